@@ -0,0 +1,49 @@
+"""Add source_rule_id to transactions
+
+Revision ID: 3b7d2f9a41c6
+Revises: e68ebb80c2fe
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2f9a41c6'
+down_revision: Union[str, None] = 'e68ebb80c2fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, None] = None
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('source_rule_id', sa.BigInteger(), nullable=True))
+    # The unique index leads with source_rule_id, so it also backs the FK
+    op.create_unique_constraint('ux_tx_rule_date', 'transactions', ['source_rule_id', 'date'])
+    op.create_foreign_key(
+        'transactions_source_rule_id_fkey', 'transactions', 'recurring_rules',
+        ['source_rule_id'], ['id'], ondelete='SET NULL'
+    )
+    # Link previously generated rows to their rule by the exact generated memo;
+    # IGNORE skips rows that would duplicate an already linked (rule, date)
+    op.execute(
+        """
+        UPDATE IGNORE transactions t
+        JOIN recurring_rules r
+          ON t.owner_user_id = r.created_by
+         AND t.amount = r.amount
+         AND t.category_id <=> r.category_id
+         AND t.merchant <=> r.merchant
+         AND t.memo = TRIM(CONCAT(COALESCE(r.memo, ''), ' (자동 생성)'))
+        SET t.source_rule_id = r.id
+        WHERE t.source_rule_id IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('transactions_source_rule_id_fkey', 'transactions', type_='foreignkey')
+    op.drop_constraint('ux_tx_rule_date', 'transactions', type_='unique')
+    op.drop_column('transactions', 'source_rule_id')
@@ -3,6 +3,7 @@ Authentication API Router
 TDD: Tests written first, now implementing to make tests pass
 """
 
+import re
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Optional
 from app.schemas.auth import (
@@ -11,6 +12,7 @@ from app.schemas.auth import (
     TokenResponse,
     AccessTokenResponse,
     UserProfileResponse,
+    UserProfileOut,
     ChangePasswordRequest,
     RefreshTokenRequest,
     ForgotPasswordRequest,
@@ -19,11 +21,15 @@ from app.schemas.auth import (
 from app.dependencies import get_auth_service, get_current_user
 from app.application.services.auth_service import AuthService
 from app.domain.models.user import User
+from app.infrastructure.repositories.auth_repository_impl import AuthRepositoryImpl
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_session
 
 router = APIRouter()
 
+# Cheap format check so malformed emails never reach the database
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
 
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def signup(
@@ -122,12 +128,7 @@ async def get_profile(
     """Get user profile"""
     return {
         "success": True,
-        "user": {
-            "id": current_user.id,
-            "name": current_user.nickname,
-            "email": current_user.email,
-            "created_at": current_user.created_at.isoformat() if hasattr(current_user.created_at, 'isoformat') else str(current_user.created_at),
-        }
+        "user": UserProfileOut.model_validate(current_user)
     }
 
 
@@ -141,19 +142,24 @@ async def update_profile(
 ):
     """Update user profile"""
     try:
-        from app.infrastructure.repositories.auth_repository_impl import AuthRepositoryImpl
-        from sqlalchemy import select, and_
+        if email and email != current_user.email and not _EMAIL_RE.match(email):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 이메일 형식입니다"
+            )
         
+        # Duplicate-email check and update run as a single statement
         auth_repo = AuthRepositoryImpl(db)
-        
-        # Email duplicate check (exclude current user)
-        if email and email != current_user.email:
-            existing_user = await auth_repo.find_user_by_email(email)
-            if existing_user and existing_user.id != current_user.id:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="이미 사용 중인 이메일입니다"
-                )
+        updated = await auth_repo.update_user_with_email_check(
+            user_id=current_user.id,
+            nickname=nickname,
+            email=email
+        )
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 사용 중인 이메일입니다"
+            )
         
         # Update fields
         if nickname:
@@ -161,17 +167,10 @@ async def update_profile(
         if email:
             current_user.email = email
         
-        updated_user = await auth_repo.update_user(current_user)
-        
         return {
             "success": True,
             "message": "프로필이 성공적으로 업데이트되었습니다",
-            "user": {
-                "id": updated_user.id,
-                "name": updated_user.nickname,
-                "email": updated_user.email,
-                "created_at": updated_user.created_at.isoformat() if hasattr(updated_user.created_at, 'isoformat') else str(updated_user.created_at),
-            }
+            "user": UserProfileOut.model_validate(current_user)
         }
     except HTTPException:
         raise
@@ -209,10 +208,19 @@ async def change_password(
 
 
 @router.get("/check-email")
-async def check_email(email: str):
+async def check_email(
+    email: str,
+    db: AsyncSession = Depends(get_session)
+):
     """Check if email is available"""
-    # TODO: Implement email check logic
-    return {"available": True, "email": email}
+    if not _EMAIL_RE.match(email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 이메일 형식입니다"
+        )
+
+    existing_user = await AuthRepositoryImpl(db).find_user_by_email(email)
+    return {"available": existing_user is None, "email": email}
 
 
 @router.post("/forgot-password")
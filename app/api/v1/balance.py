@@ -3,33 +3,41 @@ Balance API Router
 Balance management endpoints
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
 from typing import Optional
-from datetime import date, timedelta
+from datetime import date
 from app.dependencies import get_current_user
 from app.domain.models.user import User
-from app.database import get_session
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_session, get_session_factory
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.application.services.balance_service import BalanceService
 from app.infrastructure.repositories.balance_repository_impl import BalanceRepositoryImpl
 from app.domain.models.transaction import TransactionType
 from app.schemas.balance import BalanceResponse
+from app.utils.cache import get_cached, set_cached, conditional_response
+from app.utils.dates import period_bounds
 
 router = APIRouter()
 
 
-def get_balance_service(db: AsyncSession = Depends(get_session)) -> BalanceService:
+async def get_balance_service(
+    db: AsyncSession = Depends(get_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
+) -> BalanceService:
     """Dependency injection for BalanceService"""
-    balance_repo = BalanceRepositoryImpl(db)
+    balance_repo = BalanceRepositoryImpl(db, session_factory)
     return BalanceService(balance_repo, db)
 
 
-@router.get("", response_model=dict)
+@router.get("")
 async def get_balance(
+    request: Request,
+    response: Response,
     group_id: Optional[int] = Query(None, description="Group ID"),
     include_projection: bool = Query(False, description="Include projected balance"),
     projection_months: int = Query(3, ge=1, le=12, description="Number of months for projection"),
-    period: Optional[str] = Query(None, pattern=r'^\d{4}-\d{2}$', description="Period in YYYY-MM format"),
+    period: Optional[str] = Query(None, description="Period in YYYY-MM format"),
     current_user: User = Depends(get_current_user),
     service: BalanceService = Depends(get_balance_service)
 ):
@@ -42,67 +50,88 @@ async def get_balance(
     - Projected balance: Future balance including recurring transactions
     """
     try:
-        # Calculate current balance
-        current_balance = await service.calculate_balance(
-            user_id=current_user.id,
-            group_id=group_id or current_user.group_id
-        )
+        target_group_id = group_id or current_user.group_id
 
-        # Period data
-        period_data = None
+        # Serve repeated polls from the short-TTL cache
+        cache_key = ("balance", current_user.id, target_group_id, period, include_projection, projection_months)
+        cached = get_cached(cache_key)
+        if cached:
+            return conditional_response(request, response, *cached)
+
+        # Validate period before issuing any query
         if period:
             try:
-                year, month = map(int, period.split('-'))
-                start_date = date(year, month, 1)
-                if month == 12:
-                    end_date = date(year + 1, 1, 1) - timedelta(days=1)
-                else:
-                    end_date = date(year, month + 1, 1) - timedelta(days=1)
-
-                income = await service.get_amount_by_type(
-                    user_id=current_user.id,
-                    group_id=group_id or current_user.group_id,
-                    transaction_type=TransactionType.INCOME,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-
-                expense = await service.get_amount_by_type(
-                    user_id=current_user.id,
-                    group_id=group_id or current_user.group_id,
-                    transaction_type=TransactionType.EXPENSE,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-
-                period_data = {
-                    "period": period,
-                    "income": income,
-                    "expense": expense,
-                    "net_amount": income - expense
-                }
-            except (ValueError, AttributeError) as e:
+                start_date, end_date = period_bounds(period)
+            except ValueError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid period format: {str(e)}"
                 )
 
-        # Projected balance
-        projected_balance = None
-        monthly_trend = None
+        # Collect independent queries and run them concurrently.
+        # With projection, current balance and trend come from one fused scan.
+        if include_projection:
+            queries = [service.get_balance_bundle(
+                user_id=current_user.id,
+                group_id=target_group_id,
+                months=min(projection_months, 6)
+            )]
+        else:
+            queries = [service.calculate_balance(
+                user_id=current_user.id,
+                group_id=target_group_id
+            )]
+
+        if period:
+            queries.append(service.get_amount_by_type(
+                user_id=current_user.id,
+                group_id=target_group_id,
+                transaction_type=TransactionType.INCOME,
+                start_date=start_date,
+                end_date=end_date
+            ))
+            queries.append(service.get_amount_by_type(
+                user_id=current_user.id,
+                group_id=target_group_id,
+                transaction_type=TransactionType.EXPENSE,
+                start_date=start_date,
+                end_date=end_date
+            ))
 
         if include_projection:
-            projected_balance = await service.calculate_projected_balance(
+            queries.append(service.calculate_recurring_projection(
                 user_id=current_user.id,
-                group_id=group_id or current_user.group_id,
+                group_id=target_group_id,
                 months=projection_months
-            )
+            ))
 
-            monthly_trend = await service.get_monthly_trend(
-                user_id=current_user.id,
-                group_id=group_id or current_user.group_id,
-                months=min(projection_months, 6)
-            )
+        # Let every query finish before surfacing the first failure
+        results = await asyncio.gather(*queries, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        results = iter(results)
+        projected_balance = None
+        monthly_trend = None
+        if include_projection:
+            current_balance, monthly_trend = next(results)
+        else:
+            current_balance = next(results)
+
+        period_data = None
+        if period:
+            income = next(results)
+            expense = next(results)
+            period_data = {
+                "period": period,
+                "income": income,
+                "expense": expense,
+                "net_amount": income - expense
+            }
+
+        if include_projection:
+            projected_balance = current_balance + next(results)
 
         # Build response
         response_data = {
@@ -119,7 +148,7 @@ async def get_balance(
         if monthly_trend:
             response_data["monthly_trend"] = monthly_trend
 
-        return {
+        etag, payload = set_cached(cache_key, {
             "success": True,
             "data": response_data,
             "dev_info": {
@@ -127,8 +156,11 @@ async def get_balance(
                 "projection_months": projection_months,
                 "last_calculated": date.today().isoformat()
             }
-        }
+        })
+        return conditional_response(request, response, etag, payload)
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -3,7 +3,7 @@ Budgets API Router
 Budget management endpoints
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status, Path
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status, Path
 from typing import Optional
 from app.dependencies import get_current_user
 from app.domain.models.user import User
@@ -19,53 +19,62 @@ from app.schemas.budget import (
     BudgetResponse,
     BudgetStatusResponse
 )
+from app.utils.cache import get_cached, set_cached, conditional_response, invalidate_owner
+from app.utils.dates import period_bounds
 
 router = APIRouter()
 
+def _resolve_owner_id(owner_type: OwnerType, user: User) -> int:
+    """GROUP budgets belong to the user's group (if any), otherwise to the user"""
+    return user.group_id if owner_type == OwnerType.GROUP and user.group_id else user.id
 
-def get_budget_service(db: AsyncSession = Depends(get_session)) -> BudgetService:
+
+async def resolve_owner(
+    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
+    current_user: User = Depends(get_current_user)
+) -> tuple[OwnerType, int]:
+    """Resolve (owner_type, owner_id) once per request"""
+    return owner_type, _resolve_owner_id(owner_type, current_user)
+
+
+def _owner_cache_ids(owner_type: OwnerType, owner_id: int) -> tuple[Optional[int], Optional[int]]:
+    """Map a budget owner onto the (user_id, group_id) slots of a cache key"""
+    return (None, owner_id) if owner_type == OwnerType.GROUP else (owner_id, None)
+
+
+async def get_budget_service(db: AsyncSession = Depends(get_session)) -> BudgetService:
     """Dependency injection for BudgetService"""
     budget_repo = BudgetRepositoryImpl(db)
     stats_repo = StatisticsRepositoryImpl(db)
     return BudgetService(budget_repo, stats_repo, db)
 
 
-@router.get("", response_model=dict)
+@router.get("")
 async def get_budgets(
-    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
     status_filter: Optional[BudgetStatus] = Query(None, alias="status", description="Filter by status"),
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    owner: tuple[OwnerType, int] = Depends(resolve_owner),
     service: BudgetService = Depends(get_budget_service)
 ):
     """Get all budgets for the current user or group"""
     try:
-        # Determine owner_id based on owner_type
-        owner_id = current_user.group_id if owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
+        owner_type, owner_id = owner
         
-        budgets = await service.get_budgets(
+        budgets = await service.list_budgets(
             owner_type=owner_type,
             owner_id=owner_id,
-            status=status_filter
+            status=status_filter,
+            limit=limit,
+            offset=offset
         )
         
-        # Serialize budgets
-        serialized_budgets = [
-            {
-                "id": budget.id,
-                "owner_type": budget.owner_type.value,
-                "owner_id": budget.owner_id,
-                "period": budget.period,
-                "total_amount": budget.total_amount,
-                "status": budget.status.value,
-                "created_at": budget.created_at.isoformat(),
-                "updated_at": budget.updated_at.isoformat()
-            }
-            for budget in budgets
-        ]
-        
+        # Column mappings go straight to the response encoder
         return {
             "success": True,
-            "data": serialized_budgets
+            "data": budgets,
+            "limit": limit,
+            "offset": offset
         }
     except Exception as e:
         raise HTTPException(
@@ -74,7 +83,7 @@ async def get_budgets(
         )
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", status_code=status.HTTP_201_CREATED)
 async def create_or_update_budget(
     request: BudgetCreateRequest,
     current_user: User = Depends(get_current_user),
@@ -82,8 +91,7 @@ async def create_or_update_budget(
 ):
     """Create or update budget for a period"""
     try:
-        # Determine owner_id based on owner_type
-        owner_id = current_user.group_id if request.owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
+        owner_id = _resolve_owner_id(request.owner_type, current_user)
         
         budget = await service.create_or_update_budget(
             owner_type=request.owner_type,
@@ -92,19 +100,11 @@ async def create_or_update_budget(
             total_amount=request.total_amount,
             status=request.status
         )
+        invalidate_owner(*_owner_cache_ids(request.owner_type, owner_id))
         
         return {
             "success": True,
-            "data": {
-                "id": budget.id,
-                "owner_type": budget.owner_type.value,
-                "owner_id": budget.owner_id,
-                "period": budget.period,
-                "total_amount": budget.total_amount,
-                "status": budget.status.value,
-                "created_at": budget.created_at.isoformat(),
-                "updated_at": budget.updated_at.isoformat()
-            }
+            "data": BudgetResponse.model_validate(budget)
         }
     except ValueError as e:
         raise HTTPException(
@@ -118,31 +118,47 @@ async def create_or_update_budget(
         )
 
 
-@router.get("/status", response_model=dict)
+@router.get("/status")
 async def get_budget_status(
-    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
-    period: str = Query(..., pattern=r'^\d{4}-\d{2}$', description="Period in YYYY-MM format"),
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    period: str = Query(..., description="Period in YYYY-MM format"),
+    owner: tuple[OwnerType, int] = Depends(resolve_owner),
     service: BudgetService = Depends(get_budget_service)
 ):
     """Get budget status with spending breakdown"""
+    # Validate period before issuing any query
     try:
-        # Determine owner_id based on owner_type
-        owner_id = current_user.group_id if owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
-        
+        period_bounds(period)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid period format: {str(e)}"
+        )
+
+    try:
+        owner_type, owner_id = owner
+
+        # Serve repeated polls from the short-TTL cache
+        cache_key = ("budget_status", *_owner_cache_ids(owner_type, owner_id), period)
+        cached = get_cached(cache_key)
+        if cached:
+            return conditional_response(request, response, *cached)
+
         budget_status = await service.get_budget_status(
             owner_type=owner_type,
             owner_id=owner_id,
             period=period
         )
-        
-        return {
+
+        etag, payload = set_cached(cache_key, {
             "success": True,
             "data": {
                 "period": period,
                 "budget_status": budget_status
             }
-        }
+        })
+        return conditional_response(request, response, etag, payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -155,112 +171,60 @@ async def get_budget_status(
         )
 
 
-@router.get("/{budget_id}", response_model=dict)
+@router.get("/{budget_id}")
 async def get_budget(
     budget_id: int = Path(..., description="Budget ID"),
-    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
-    current_user: User = Depends(get_current_user),
+    owner: tuple[OwnerType, int] = Depends(resolve_owner),
     service: BudgetService = Depends(get_budget_service)
 ):
     """Get a specific budget by ID"""
-    try:
-        owner_id = current_user.group_id if owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
-        
-        budget = await service.get_budget(budget_id, owner_type, owner_id)
-        
-        return {
-            "success": True,
-            "data": {
-                "id": budget.id,
-                "owner_type": budget.owner_type.value,
-                "owner_id": budget.owner_id,
-                "period": budget.period,
-                "total_amount": budget.total_amount,
-                "status": budget.status.value,
-                "created_at": budget.created_at.isoformat(),
-                "updated_at": budget.updated_at.isoformat()
-            }
-        }
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"예산 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    owner_type, owner_id = owner
+    
+    budget = await service.get_budget(budget_id, owner_type, owner_id)
+    
+    return {
+        "success": True,
+        "data": BudgetResponse.model_validate(budget)
+    }
 
 
-@router.put("/{budget_id}", response_model=dict)
+@router.put("/{budget_id}")
 async def update_budget(
     budget_id: int = Path(..., description="Budget ID"),
     request: BudgetUpdateRequest = ...,
-    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
-    current_user: User = Depends(get_current_user),
+    owner: tuple[OwnerType, int] = Depends(resolve_owner),
     service: BudgetService = Depends(get_budget_service)
 ):
     """Update a budget"""
-    try:
-        owner_id = current_user.group_id if owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
-        
-        budget = await service.get_budget(budget_id, owner_type, owner_id)
-        
-        # Update fields
-        if request.total_amount is not None:
-            budget.total_amount = request.total_amount
-        if request.status is not None:
-            budget.status = request.status
-        
-        updated_budget = await service.budget_repository.update(budget)
-        
-        return {
-            "success": True,
-            "data": {
-                "id": updated_budget.id,
-                "owner_type": updated_budget.owner_type.value,
-                "owner_id": updated_budget.owner_id,
-                "period": updated_budget.period,
-                "total_amount": updated_budget.total_amount,
-                "status": updated_budget.status.value,
-                "created_at": updated_budget.created_at.isoformat(),
-                "updated_at": updated_budget.updated_at.isoformat()
-            }
-        }
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"예산 수정 중 오류가 발생했습니다: {str(e)}"
-        )
+    owner_type, owner_id = owner
+    
+    budget = await service.get_budget(budget_id, owner_type, owner_id)
+    
+    # Update fields
+    if request.total_amount is not None:
+        budget.total_amount = request.total_amount
+    if request.status is not None:
+        budget.status = request.status
+    
+    updated_budget = await service.budget_repository.update(budget)
+    invalidate_owner(*_owner_cache_ids(owner_type, owner_id))
+    
+    return {
+        "success": True,
+        "data": BudgetResponse.model_validate(updated_budget)
+    }
 
 
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_budget(
     budget_id: int = Path(..., description="Budget ID"),
-    owner_type: OwnerType = Query(..., description="Owner type: USER or GROUP"),
-    current_user: User = Depends(get_current_user),
+    owner: tuple[OwnerType, int] = Depends(resolve_owner),
     service: BudgetService = Depends(get_budget_service)
 ):
     """Delete a budget"""
-    try:
-        owner_id = current_user.group_id if owner_type == OwnerType.GROUP and current_user.group_id else current_user.id
-        
-        await service.delete_budget(budget_id, owner_type, owner_id)
-        return None
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND if "not found" in str(e).lower() else status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"예산 삭제 중 오류가 발생했습니다: {str(e)}"
-        )
+    owner_type, owner_id = owner
+    
+    await service.delete_budget(budget_id, owner_type, owner_id)
+    invalidate_owner(*_owner_cache_ids(owner_type, owner_id))
+    return None
 
@@ -3,7 +3,9 @@ Category API Router
 Category management endpoints
 """
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.encoders import jsonable_encoder
 from app.domain.models.category import Category
 from app.dependencies import get_current_user
 from app.domain.models.user import User
@@ -15,6 +17,20 @@ from typing import Optional
 
 router = APIRouter()
 
+# Encoded category lists keyed by (group_id, type); categories change rarely
+_cat_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+
+def evict_category_list(group_id: Optional[int], type: str) -> None:
+    """Drop the cached category list after a category is created"""
+    _cat_cache.pop((group_id, type), None)
+
+
+async def get_category_service(db: AsyncSession = Depends(get_session)) -> CategoryService:
+    """Dependency injection for CategoryService"""
+    category_repo = CategoryRepositoryImpl(db)
+    return CategoryService(category_repo)
+
 
 @router.get("", response_model=list)
 async def get_categories(
@@ -23,16 +39,22 @@ async def get_categories(
     db: AsyncSession = Depends(get_session)
 ):
     """Get categories by type"""
-    category_repo = CategoryRepositoryImpl(db)
-    category_service = CategoryService(category_repo)
-    
     # Get user's group_id
     group_id = current_user.group_id
     
-    categories = await category_service.get_categories(
+    key = (group_id, type)
+    cached = _cat_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    category_repo = CategoryRepositoryImpl(db)
+    category_service = CategoryService(category_repo)
+    
+    categories = await category_service.list_categories(
         group_id=group_id,
         type=type
     )
+    _cat_cache[key] = categories = jsonable_encoder(categories)
     return categories
 
 
@@ -43,12 +65,9 @@ async def create_category(
     color: Optional[str] = None,
     budget_amount: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_session)
+    category_service: CategoryService = Depends(get_category_service)
 ):
     """Create new category"""
-    category_repo = CategoryRepositoryImpl(db)
-    category_service = CategoryService(category_repo)
-    
     category = Category(
         group_id=current_user.group_id,
         created_by=current_user.id,
@@ -60,6 +79,7 @@ async def create_category(
     
     try:
         result = await category_service.create_category(category)
+        evict_category_list(current_user.group_id, type)
         return result
     except ValueError as e:
         raise HTTPException(
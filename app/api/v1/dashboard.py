@@ -4,31 +4,42 @@ Dashboard endpoints for monthly stats
 """
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from typing import Optional
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, Optional
 from app.dependencies import get_current_user
 from app.domain.models.user import User
-from app.database import get_session
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_session, get_session_factory
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.application.services.dashboard_service import DashboardService
 from app.infrastructure.repositories.statistics_repository_impl import StatisticsRepositoryImpl
+from app.utils.cache import monthly_stats_cache
+from app.utils.clock import today as current_date
 
 router = APIRouter()
 
+# Supported dashboard range, checked with one hash lookup each
+_VALID_YEARS = frozenset(range(2020, 2031))
+_VALID_MONTHS = frozenset(range(1, 13))
 
-def get_dashboard_service(db: AsyncSession = Depends(get_session)) -> DashboardService:
+
+async def get_dashboard_service(
+    db: AsyncSession = Depends(get_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
+) -> DashboardService:
     """Dependency injection for DashboardService"""
-    repository = StatisticsRepositoryImpl(db)
-    return DashboardService(repository)
+    return DashboardService(StatisticsRepositoryImpl(db, session_factory))
+
+
+DashboardServiceDep = Annotated[DashboardService, Depends(get_dashboard_service)]
 
 
-@router.get("/monthly-stats", response_model=dict)
+@router.get("/monthly-stats")
 async def get_monthly_stats(
+    service: DashboardServiceDep,
     year: int = Query(None, description="Year (e.g., 2025)"),
     month: int = Query(None, description="Month (1-12)"),
     group_id: Optional[int] = Query(None, description="Group ID filter"),
-    current_user: User = Depends(get_current_user),
-    service: DashboardService = Depends(get_dashboard_service)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get optimized monthly statistics for dashboard
@@ -39,35 +50,32 @@ async def get_monthly_stats(
         - Top 5 expense categories
         - Daily trend
     """
-    try:
-        # Default to current month if not specified
-        today = datetime.now().date()
-        target_year = year or today.year
-        target_month = month or today.month
-        
-        # Validate date
-        if target_year < 2020 or target_year > 2030 or target_month < 1 or target_month > 12:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="올바르지 않은 날짜입니다"
-            )
-        
+    # Default to current month if not specified
+    today = current_date()
+    target_year = year or today.year
+    target_month = month or today.month
+    
+    # Validate date
+    if target_year not in _VALID_YEARS or target_month not in _VALID_MONTHS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 날짜입니다"
+        )
+    
+    # Closed months are served from cache; transaction writes invalidate it
+    cache_key = ("dash_monthly", current_user.id, group_id, target_year, target_month)
+    stats = monthly_stats_cache.get(cache_key)
+    if stats is None:
         stats = await service.get_monthly_stats(
             user_id=current_user.id,
             year=target_year,
             month=target_month,
             group_id=group_id
         )
-        
-        return {
-            "success": True,
-            "data": stats
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"월별 통계 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+        monthly_stats_cache[cache_key] = stats
+    
+    return ORJSONResponse({
+        "success": True,
+        "data": stats
+    })
 
@@ -13,7 +13,6 @@ from app.schemas.group import (
 from app.dependencies import get_group_service, get_current_user
 from app.application.services.group_service import GroupService
 from app.domain.models.user import User
-from datetime import datetime
 
 router = APIRouter()
 
@@ -101,8 +100,8 @@ async def generate_invite_code(
 ):
     """Generate invite code for group"""
     try:
-        code = await service.generate_invite_code(group_id, current_user.id)
-        return InviteCodeResponse(code=code, expires_at=str(datetime.now()))
+        code, expires_at = await service.generate_invite_code(group_id, current_user.id)
+        return InviteCodeResponse(code=code, expires_at=expires_at.isoformat())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
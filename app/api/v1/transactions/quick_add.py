@@ -3,19 +3,30 @@ Quick Add Transaction API
 Fast transaction creation with category auto-creation
 """
 
+import random
 from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi.responses import ORJSONResponse
 from app.dependencies import get_current_user
 from app.domain.models.user import User
 from app.domain.models.transaction import Transaction as TransactionModel, TransactionType
 from app.domain.models.category import Category
 from app.database import get_session
+from app.utils.cache import invalidate_owner
+from app.api.v1.categories import evict_category_list
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from datetime import date
 from typing import Optional
 from pydantic import BaseModel, Field
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Palette for auto-created categories
+_CATEGORY_COLORS = (
+    '#ef4444', '#f97316', '#eab308', '#22c55e',
+    '#06b6d4', '#3b82f6', '#8b5cf6', '#ec4899'
+)
 
 
 class QuickAddTransactionRequest(BaseModel):
@@ -31,7 +42,7 @@ class QuickAddTransactionRequest(BaseModel):
         populate_by_name = True
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", status_code=status.HTTP_201_CREATED)
 async def quick_add_transaction(
     request: QuickAddTransactionRequest = Body(...),
     current_user: User = Depends(get_current_user),
@@ -43,45 +54,53 @@ async def quick_add_transaction(
     This endpoint allows fast transaction creation without requiring
     a category ID. If the category doesn't exist, it will be created automatically.
     """
+    # Verify group membership before touching the session, so rejected
+    # requests never check out a pooled connection
+    group_id = request.group_id or current_user.group_id
+    if group_id and current_user.group_id != group_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="그룹에 접근 권한이 없습니다"
+        )
+
     try:
-        # Verify group membership if group_id is provided
-        group_id = request.group_id or current_user.group_id
-        if group_id and current_user.group_id != group_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="그룹에 접근 권한이 없습니다"
-            )
-
-        # Find or create category
-        category_stmt = select(Category).where(
+        # Find or create category; personal categories (no group) are
+        # scoped to their creator since ux_category_name ignores NULLs
+        category_stmt = select(Category.id, Category.color).where(
             Category.name == request.category_name,
             Category.type == request.type.value,
             Category.group_id == group_id
         )
+        if group_id is None:
+            category_stmt = category_stmt.where(Category.created_by == current_user.id)
         
-        category_result = await db.execute(category_stmt)
-        category = category_result.scalar_one_or_none()
+        category_row = (await db.execute(category_stmt)).first()
 
-        if not category:
+        created_category = category_row is None
+        if category_row:
+            category_id, category_color = category_row
+        else:
             # Create new category with random color
-            colors = [
-                '#ef4444', '#f97316', '#eab308', '#22c55e',
-                '#06b6d4', '#3b82f6', '#8b5cf6', '#ec4899'
-            ]
-            import random
-            random_color = random.choice(colors)
-
-            category = Category(
+            category_color = random.choice(_CATEGORY_COLORS)
+
+            # Upsert so a concurrent quick add of the same category reuses the
+            # row instead of failing on ux_category_name; LAST_INSERT_ID(id)
+            # reports the existing id on conflict (MySQL has no RETURNING)
+            upsert_stmt = mysql_insert(Category).values(
                 name=request.category_name,
                 type=request.type.value,
-                color=random_color,
+                color=category_color,
                 group_id=group_id,
                 created_by=current_user.id,
                 is_default=False
-            )
-            db.add(category)
-            await db.commit()
-            await db.refresh(category)
+            ).on_duplicate_key_update(id=func.last_insert_id(Category.id))
+            category_id = (await db.execute(upsert_stmt)).lastrowid
+
+            # On conflict the stored row keeps its own color, not the one
+            # drawn above; rowcount can't tell the cases apart (FOUND_ROWS)
+            category_color = (await db.execute(
+                select(Category.color).where(Category.id == category_id)
+            )).scalar_one()
 
         # Create transaction
         transaction = TransactionModel(
@@ -90,40 +109,41 @@ async def quick_add_transaction(
             type=request.type.value,
             date=request.transaction_date,
             amount=request.amount,
-            category_id=category.id,
+            category_id=category_id,
             merchant=None,
             memo=request.memo
         )
 
         db.add(transaction)
         await db.commit()
-        await db.refresh(transaction)
+        # Only the server-generated timestamps are unknown after the insert
+        await db.refresh(transaction, ["created_at", "updated_at"])
+        invalidate_owner(current_user.id, group_id)
+        if created_category:
+            evict_category_list(group_id, request.type.value)
 
-        # Load category for response
-        await db.refresh(category)
-
-        # Format response
+        # Format response; orjson encodes dates and ints natively
         transaction_dict = {
             "id": transaction.id,
             "type": transaction.type,
-            "date": transaction.date.isoformat(),
-            "amount": str(transaction.amount),
+            "date": transaction.date,
+            "amount": transaction.amount,
             "category": {
-                "id": category.id,
-                "name": category.name,
-                "color": category.color,
-                "type": category.type
+                "id": category_id,
+                "name": request.category_name,
+                "color": category_color,
+                "type": request.type.value
             },
             "memo": transaction.memo,
-            "created_at": transaction.created_at.isoformat(),
-            "updated_at": transaction.updated_at.isoformat()
+            "created_at": transaction.created_at,
+            "updated_at": transaction.updated_at
         }
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "transaction": transaction_dict,
             "message": "거래가 성공적으로 추가되었습니다"
-        }
+        }, status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
@@ -3,7 +3,10 @@ Transaction API Router
 Transaction management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import orjson
 from app.schemas.transaction import (
     TransactionCreateRequest,
     TransactionUpdateRequest,
@@ -13,20 +16,22 @@ from app.schemas.transaction import (
 )
 from app.dependencies import get_transaction_service, get_current_user
 from app.application.services.transaction_service import TransactionService
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepositoryImpl
+from app.database import get_session_factory
+from app.api.v1.transactions.quick_add import router as quick_add_router
 from app.domain.models.user import User
 from app.domain.models.transaction import Transaction as TransactionModel
+from app.utils.cache import invalidate_owner, transaction_cache
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, AsyncIterator
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Transactions encoded per orjson call when streaming an export
+_STREAM_BATCH_SIZE = 100
 
 # Include quick-add router
-try:
-    from app.api.v1.transactions.quick_add import router as quick_add_router
-    router.include_router(quick_add_router, prefix="/quick-add", tags=["Transactions"])
-except ImportError:
-    # Quick-add router not available, skip
-    pass
+router.include_router(quick_add_router, prefix="/quick-add", tags=["Transactions"])
 
 
 @router.get("", response_model=PaginatedResponse)
@@ -60,6 +65,48 @@ async def get_transactions(
     )
 
 
+@router.get("/export")
+async def export_transactions(
+    group_id: Optional[int] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    category_id: Optional[int] = Query(None),
+    search: Optional[str] = Query(None, description="Search in memo and merchant"),
+    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory)
+):
+    """Export all matching transactions (streamed, unpaginated)"""
+    user_id = current_user.id
+
+    async def stream_transactions() -> AsyncIterator[bytes]:
+        # The request session is closed before a streamed body is sent,
+        # so the generator reads through its own session
+        async with session_factory() as session:
+            service = TransactionService(TransactionRepositoryImpl(session))
+            yield b'{"items":['
+            separator = b''
+            batch = []
+            async for transaction in service.iter_transactions(
+                group_id=group_id,
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                category_id=category_id,
+                search=search
+            ):
+                batch.append(TransactionResponse.model_validate(transaction).model_dump())
+                if len(batch) == _STREAM_BATCH_SIZE:
+                    # Encode the batch as one array and splice in its items
+                    yield separator + orjson.dumps(batch)[1:-1]
+                    separator = b','
+                    batch = []
+            if batch:
+                yield separator + orjson.dumps(batch)[1:-1]
+            yield b']}'
+
+    return StreamingResponse(stream_transactions(), media_type="application/json")
+
+
 @router.post("", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     request: TransactionCreateRequest,
@@ -80,6 +127,7 @@ async def create_transaction(
     )
     try:
         result = await service.create_transaction(transaction)
+        invalidate_owner(current_user.id, request.group_id or current_user.group_id)
         return result
     except ValueError as e:
         raise HTTPException(
@@ -95,14 +143,20 @@ async def get_transaction(
     service: TransactionService = Depends(get_transaction_service)
 ):
     """Get transaction by ID"""
-    try:
-        transaction = await service.get_transaction(transaction_id, current_user.id)
-        return transaction
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    cache_key = (current_user.id, transaction_id)
+    payload = transaction_cache.get(cache_key)
+    if payload is None:
+        try:
+            transaction = await service.get_transaction(transaction_id, current_user.id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            )
+        payload = TransactionResponse.model_validate(transaction).model_dump(mode="json")
+        transaction_cache[cache_key] = payload
+    
+    return ORJSONResponse(payload)
 
 
 @router.put("/{transaction_id}", response_model=TransactionResponse)
@@ -113,8 +167,8 @@ async def update_transaction(
     service: TransactionService = Depends(get_transaction_service)
 ):
     """Update transaction"""
-    # Convert to dict, filtering None values
-    update_data = {k: v for k, v in request.dict().items() if v is not None}
+    # Only fields the client sent; an explicit null clears an optional field
+    update_data = request.model_dump(exclude_unset=True)
     
     try:
         transaction = await service.update_transaction(
@@ -122,6 +176,8 @@ async def update_transaction(
             current_user.id,
             update_data
         )
+        transaction_cache.pop((current_user.id, transaction_id), None)
+        invalidate_owner(current_user.id, current_user.group_id)
         return transaction
     except ValueError as e:
         raise HTTPException(
@@ -130,7 +186,7 @@ async def update_transaction(
         )
 
 
-@router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 async def delete_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
@@ -139,9 +195,12 @@ async def delete_transaction(
     """Delete transaction"""
     try:
         await service.delete_transaction(transaction_id, current_user.id)
+        transaction_cache.pop((current_user.id, transaction_id), None)
+        invalidate_owner(current_user.id, current_user.group_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
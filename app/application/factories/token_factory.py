@@ -3,44 +3,59 @@ Token Factory
 Factory pattern for creating authentication tokens
 """
 
+import time
 from datetime import timedelta
 from dataclasses import dataclass
+from cachetools import TTLCache
 from app.infrastructure.security.jwt_handler import create_access_token, create_refresh_token, verify_and_decode_token
 from app.config import settings
 
+DECODED_TOKEN_TTL = 60  # seconds
 
-@dataclass
+# Verified payloads keyed by (token, token_type); failures are never cached
+_decoded_tokens: TTLCache = TTLCache(maxsize=4096, ttl=DECODED_TOKEN_TTL)
+
+
+@dataclass(slots=True)
 class AuthTokens:
     """Authentication tokens"""
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
+    
+    def to_dict(self, refresh: bool = True) -> dict:
+        """Response payload, optionally without the refresh token"""
+        tokens = {"access_token": self.access_token, "token_type": self.token_type}
+        if refresh:
+            tokens["refresh_token"] = self.refresh_token
+        return tokens
 
 
-class TokenFactory:
-    """Factory for creating authentication tokens"""
+def create_tokens(user_id: int, email: str) -> AuthTokens:
+    """Create both access and refresh tokens"""
+    payload = {
+        "sub": str(user_id),
+        "email": email
+    }
     
-    @staticmethod
-    def create_tokens(user_id: int, email: str) -> AuthTokens:
-        """Create both access and refresh tokens"""
-        payload = {
-            "sub": str(user_id),
-            "email": email
-        }
-        
-        access_token = create_access_token(
-            payload,
-            expires_delta=timedelta(minutes=settings.access_token_expire_minutes)
-        )
-        refresh_token = create_refresh_token(payload)
-        
-        return AuthTokens(
-            access_token=access_token,
-            refresh_token=refresh_token
-        )
+    access_token = create_access_token(
+        payload,
+        expires_delta=timedelta(minutes=settings.access_token_expire_minutes)
+    )
+    refresh_token = create_refresh_token(payload)
     
-    @staticmethod
-    def get_user_from_token(token: str, token_type: str = "access") -> dict:
-        """Extract user info from token"""
-        return verify_and_decode_token(token, token_type)
+    return AuthTokens(
+        access_token=access_token,
+        refresh_token=refresh_token
+    )
+
 
+def get_user_from_token(token: str, token_type: str = "access") -> dict:
+    """Extract user info from token, skipping re-verification of recent tokens"""
+    key = (token, token_type)
+    payload = _decoded_tokens.get(key)
+    # A cached payload must not outlive the token's own expiry
+    if payload is None or payload.get("exp", 0) <= time.time():
+        payload = verify_and_decode_token(token, token_type)
+        _decoded_tokens[key] = payload
+    return payload
@@ -5,9 +5,11 @@ Business logic for authentication use cases
 
 from typing import Optional
 from app.domain.repositories.auth_repository import AuthRepository
-from app.infrastructure.security.password_hasher import hash_password, verify_password
-from app.application.factories.token_factory import TokenFactory
+from app.infrastructure.security.password_hasher import hash_password, verify_password, run_hasher
+from app.infrastructure.security.jwt_handler import create_reset_token, verify_and_decode_token
+from app.application.factories.token_factory import create_tokens, get_user_from_token
 from app.domain.models.user import User
+from app.utils.exceptions import NotFoundError, ValidationError
 from datetime import datetime, timedelta
 
 
@@ -19,7 +21,6 @@ class AuthService:
         auth_repository: AuthRepository
     ):
         self.auth_repository = auth_repository
-        self.token_factory = TokenFactory()
     
     async def signup(
         self,
@@ -36,10 +37,10 @@ class AuthService:
         # Check if user already exists
         existing_user = await self.auth_repository.find_user_by_email(email)
         if existing_user:
-            raise ValueError("Email already registered")
+            raise ValidationError("Email already registered")
         
         # Hash password
-        password_hash = hash_password(password)
+        password_hash = await run_hasher(hash_password, password)
         
         # Create user
         user = await self.auth_repository.create_user(
@@ -49,13 +50,9 @@ class AuthService:
         )
         
         # Create tokens
-        tokens = self.token_factory.create_tokens(user.id, user.email)
+        tokens = create_tokens(user.id, user.email)
         
-        return user, {
-            "access_token": tokens.access_token,
-            "refresh_token": tokens.refresh_token,
-            "token_type": tokens.token_type
-        }
+        return user, tokens.to_dict()
     
     async def login(self, email: str, password: str) -> dict:
         """
@@ -67,25 +64,22 @@ class AuthService:
         # Find user
         user = await self.auth_repository.find_user_by_email(email)
         if not user:
-            raise ValueError("Invalid credentials")
+            raise ValidationError("Invalid credentials")
         
         # Verify password
-        if not verify_password(password, user.password_hash):
-            raise ValueError("Invalid credentials")
+        if not await run_hasher(verify_password, password, user.password_hash):
+            raise ValidationError("Invalid credentials")
         
         # Create tokens
-        tokens = self.token_factory.create_tokens(user.id, user.email)
-        
-        return {
-            "access_token": tokens.access_token,
-            "refresh_token": tokens.refresh_token,
-            "token_type": tokens.token_type,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "nickname": user.nickname
-            }
+        tokens = create_tokens(user.id, user.email)
+        
+        result = tokens.to_dict()
+        result["user"] = {
+            "id": user.id,
+            "email": user.email,
+            "nickname": user.nickname
         }
+        return result
     
     async def refresh_token(self, refresh_token: str) -> dict:
         """
@@ -95,21 +89,18 @@ class AuthService:
             New access token
         """
         # Verify and decode refresh token
-        payload = self.token_factory.get_user_from_token(refresh_token, "refresh")
-        user_id = int(payload["sub"])
+        payload = get_user_from_token(refresh_token, "refresh")
+        user_id = payload["sub"]
         
         # Find user
         user = await self.auth_repository.find_user_by_id(user_id)
         if not user:
-            raise ValueError("User not found")
+            raise NotFoundError("User not found")
         
         # Create new access token
-        tokens = self.token_factory.create_tokens(user.id, user.email)
+        tokens = create_tokens(user.id, user.email)
         
-        return {
-            "access_token": tokens.access_token,
-            "token_type": tokens.token_type
-        }
+        return tokens.to_dict(refresh=False)
     
     async def get_current_user(self, token: str) -> User:
         """
@@ -118,12 +109,12 @@ class AuthService:
         Returns:
             User
         """
-        payload = self.token_factory.get_user_from_token(token, "access")
-        user_id = int(payload["sub"])
+        payload = get_user_from_token(token, "access")
+        user_id = payload["sub"]
         
         user = await self.auth_repository.find_user_by_id(user_id)
         if not user:
-            raise ValueError("User not found")
+            raise NotFoundError("User not found")
         
         return user
     
@@ -136,14 +127,14 @@ class AuthService:
         """Change user password"""
         user = await self.auth_repository.find_user_by_id(user_id)
         if not user:
-            raise ValueError("User not found")
+            raise NotFoundError("User not found")
         
         # Verify old password
-        if not verify_password(old_password, user.password_hash):
-            raise ValueError("Invalid password")
+        if not await run_hasher(verify_password, old_password, user.password_hash):
+            raise ValidationError("Invalid password")
         
         # Update password
-        new_hash = hash_password(new_password)
+        new_hash = await run_hasher(hash_password, new_password)
         user.password_hash = new_hash
         await self.auth_repository.update_user(user)
     
@@ -152,17 +143,16 @@ class AuthService:
         Generate password reset token for user
         
         Returns:
-            Reset token
+            Reset token, or an empty string when no user has this email
         """
         # Find user by email
         user = await self.auth_repository.find_user_by_email(email)
         if not user:
-            # Don't reveal if email exists for security
-            # Return a dummy token to prevent email enumeration
-            pass
+            # Don't reveal if email exists for security; token signing is
+            # cheap, so both paths cost the same single lookup
+            return ""
         
         # Create reset token (valid for 1 hour)
-        from app.infrastructure.security.jwt_handler import create_reset_token
         reset_token = create_reset_token(user.id, user.email, timedelta(hours=1))
         
         # TODO: Send email with reset link
@@ -180,26 +170,25 @@ class AuthService:
             new_password: New password
         """
         # Verify reset token
-        from app.infrastructure.security.jwt_handler import verify_and_decode_token
         try:
             payload = verify_and_decode_token(token, "reset")
         except Exception:
-            raise ValueError("Invalid or expired reset token")
+            raise ValidationError("Invalid or expired reset token")
         
-        user_id = int(payload["sub"])
+        user_id = payload["sub"]
         email = payload.get("email")
         
         # Find user
         user = await self.auth_repository.find_user_by_id(user_id)
         if not user:
-            raise ValueError("User not found")
+            raise NotFoundError("User not found")
         
         # Verify email matches
         if email and user.email != email:
-            raise ValueError("Invalid token")
+            raise ValidationError("Invalid token")
         
         # Update password
-        new_hash = hash_password(new_password)
+        new_hash = await run_hasher(hash_password, new_password)
         user.password_hash = new_hash
         await self.auth_repository.update_user(user)
 
@@ -9,8 +9,9 @@ from app.domain.repositories.balance_repository import BalanceRepository
 from app.domain.models.transaction import TransactionType
 from app.domain.models.recurring_rule import RecurringFrequency
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, case, func
 from app.domain.models.recurring_rule import RecurringRule
+from app.domain.models.category import Category
 
 
 class BalanceService:
@@ -71,6 +72,19 @@ class BalanceService:
             months=months
         )
 
+    async def get_balance_bundle(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        months: int = 6
+    ) -> tuple[int, list[dict]]:
+        """Get current balance and monthly trend from a single scan"""
+        return await self.balance_repository.compute_balance_bundle(
+            user_id=user_id,
+            group_id=group_id,
+            months=months
+        )
+
     async def calculate_projected_balance(
         self,
         user_id: Optional[int] = None,
@@ -84,44 +98,45 @@ class BalanceService:
             group_id=group_id
         )
 
-        # Get active recurring rules
-        owner_id = group_id if group_id else user_id
-        if not owner_id:
-            return current_balance
-
-        stmt = select(RecurringRule).where(
-            and_(
-                RecurringRule.created_by == owner_id if user_id else True,
-                RecurringRule.group_id == group_id if group_id else True,
-                RecurringRule.is_active == True
-            )
+        return current_balance + await self.calculate_recurring_projection(
+            user_id=user_id,
+            group_id=group_id,
+            months=months
+        )
+
+    async def calculate_recurring_projection(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        months: int = 3
+    ) -> int:
+        """Calculate net amount active recurring rules add over the next months"""
+        if not group_id and not user_id:
+            return 0
+
+        # Active recurring rules; only applicable predicates reach SQL
+        conditions = [RecurringRule.is_active == True]
+        if group_id:
+            conditions.append(RecurringRule.group_id == group_id)
+        else:
+            conditions.append(RecurringRule.created_by == user_id)
+
+        # Occurrences per rule over the horizon (~4 weeks / ~30 days per month)
+        occurrences = case(
+            (RecurringRule.frequency == RecurringFrequency.MONTHLY, months),
+            (RecurringRule.frequency == RecurringFrequency.WEEKLY, months * 4),
+            (RecurringRule.frequency == RecurringFrequency.DAILY, months * 30),
+            else_=0
         )
+        # Rules count as expenses unless their category says INCOME
+        sign = case((Category.type == "INCOME", 1), else_=-1)
+
+        stmt = select(
+            func.coalesce(func.sum(RecurringRule.amount * occurrences * sign), 0)
+        ).select_from(RecurringRule).outerjoin(
+            Category, RecurringRule.category_id == Category.id
+        ).where(*conditions)
 
         result = await self.session.execute(stmt)
-        recurring_rules = result.scalars().all()
-
-        # Calculate projected amount from recurring rules
-        projected_amount = 0
-
-        for rule in recurring_rules:
-            frequency = 0
-
-            if rule.frequency == RecurringFrequency.MONTHLY:
-                frequency = months
-            elif rule.frequency == RecurringFrequency.WEEKLY:
-                frequency = months * 4  # Approximately 4 weeks per month
-            elif rule.frequency == RecurringFrequency.DAILY:
-                frequency = months * 30  # Approximately 30 days per month
-
-            # Amount is positive, but EXPENSE should be negative
-            rule_amount = int(rule.amount)
-            
-            # Determine if rule is expense or income based on category
-            # For simplicity, assume all recurring rules are expenses unless category says otherwise
-            if rule.category and rule.category.type == "INCOME":
-                projected_amount += rule_amount * frequency
-            else:
-                projected_amount -= rule_amount * frequency
-
-        return current_balance + projected_amount
+        return int(result.scalar_one())
 
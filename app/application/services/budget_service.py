@@ -3,14 +3,46 @@ Budget Service
 Business logic for budget use cases
 """
 
-from typing import Optional, List
-from datetime import date, datetime
+from typing import Optional, List, Sequence
+from datetime import datetime
 from app.domain.repositories.budget_repository import BudgetRepository
 from app.domain.repositories.statistics_repository import StatisticsRepository
 from app.domain.models.budget import Budget, OwnerType, BudgetStatus
 from app.domain.models.category import Category
+from app.domain.models.transaction import Transaction, TransactionType
+from app.utils.dates import period_bounds
+from app.utils.exceptions import NotFoundError, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, bindparam, RowMapping
+
+
+# Budget status breakdown, built once; values are bound per call. Each
+# budgeted expense category (Category.type is stored as string) is joined to
+# its expense transactions in the period and summed in the same statement.
+_CATEGORY_SPENT = func.coalesce(func.sum(Transaction.amount), 0).label("spent")
+_BUDGET_BREAKDOWN = select(
+    Category.id,
+    Category.name,
+    Category.budget_amount,
+    _CATEGORY_SPENT
+).outerjoin(
+    Transaction,
+    and_(
+        Transaction.category_id == Category.id,
+        Transaction.type == TransactionType.EXPENSE,
+        Transaction.date >= bindparam("start_date"),
+        Transaction.date <= bindparam("end_date")
+    )
+).where(
+    and_(
+        Category.budget_amount > 0,
+        Category.type == "EXPENSE"
+    )
+).group_by(
+    Category.id, Category.name, Category.budget_amount
+).order_by(Category.id)
+_GROUP_BUDGET_BREAKDOWN = _BUDGET_BREAKDOWN.where(Category.group_id == bindparam("owner_id"))
+_USER_BUDGET_BREAKDOWN = _BUDGET_BREAKDOWN.where(Category.created_by == bindparam("owner_id"))
 
 
 class BudgetService:
@@ -30,13 +62,34 @@ class BudgetService:
         self,
         owner_type: OwnerType,
         owner_id: int,
-        status: Optional[BudgetStatus] = None
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Budget]:
-        """Get budgets with filters"""
+        """Get budgets with filters and pagination"""
         return await self.budget_repository.find_all(
             owner_type=owner_type,
             owner_id=owner_id,
-            status=status
+            status=status,
+            limit=limit,
+            offset=offset
+        )
+    
+    async def list_budgets(
+        self,
+        owner_type: OwnerType,
+        owner_id: int,
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Sequence[RowMapping]:
+        """Get budgets as read-only rows for listing"""
+        return await self.budget_repository.list_budgets_raw(
+            owner_type=owner_type,
+            owner_id=owner_id,
+            status=status,
+            limit=limit,
+            offset=offset
         )
     
     async def get_budget(
@@ -45,14 +98,10 @@ class BudgetService:
         owner_type: OwnerType,
         owner_id: int
     ) -> Budget:
-        """Get budget by ID"""
-        budget = await self.budget_repository.find_by_id(budget_id)
+        """Get budget by ID; budgets of other owners are reported as not found"""
+        budget = await self.budget_repository.find_owned(budget_id, owner_type, owner_id)
         if not budget:
-            raise ValueError("Budget not found")
-        
-        # Check ownership
-        if budget.owner_type != owner_type or budget.owner_id != owner_id:
-            raise ValueError("Unauthorized")
+            raise NotFoundError("Budget not found")
         
         return budget
     
@@ -69,30 +118,18 @@ class BudgetService:
         try:
             datetime.strptime(period, "%Y-%m")
         except ValueError:
-            raise ValueError("Period must be in YYYY-MM format")
+            raise ValidationError("Period must be in YYYY-MM format")
         
-        # Check if budget exists
-        existing = await self.budget_repository.find_by_owner_and_period(
+        # Insert, or update the existing budget for the period in the same
+        # statement (ux_budget_owner_period)
+        budget = Budget(
             owner_type=owner_type,
             owner_id=owner_id,
-            period=period
+            period=period,
+            total_amount=total_amount,
+            status=status
         )
-        
-        if existing:
-            # Update existing budget
-            existing.total_amount = total_amount
-            existing.status = status
-            return await self.budget_repository.update(existing)
-        else:
-            # Create new budget
-            budget = Budget(
-                owner_type=owner_type,
-                owner_id=owner_id,
-                period=period,
-                total_amount=total_amount,
-                status=status
-            )
-            return await self.budget_repository.create(budget)
+        return await self.budget_repository.upsert(budget)
     
     async def delete_budget(
         self,
@@ -100,16 +137,10 @@ class BudgetService:
         owner_type: OwnerType,
         owner_id: int
     ) -> None:
-        """Delete budget"""
-        budget = await self.budget_repository.find_by_id(budget_id)
-        if not budget:
-            raise ValueError("Budget not found")
-        
-        # Check ownership
-        if budget.owner_type != owner_type or budget.owner_id != owner_id:
-            raise ValueError("Unauthorized")
-        
-        await self.budget_repository.delete(budget_id)
+        """Delete budget; budgets of other owners are reported as not found"""
+        deleted = await self.budget_repository.delete_if_owned(budget_id, owner_type, owner_id)
+        if not deleted:
+            raise NotFoundError("Budget not found")
     
     async def get_budget_status(
         self,
@@ -135,17 +166,9 @@ class BudgetService:
         
         # Parse period to get date range
         try:
-            year, month = map(int, period.split('-'))
-            start_date = date(year, month, 1)
-            if month == 12:
-                end_date = date(year + 1, 1, 1)
-            else:
-                end_date = date(year, month + 1, 1)
-            end_date = end_date.replace(day=1)
-            from datetime import timedelta
-            end_date = end_date - timedelta(days=1)
-        except (ValueError, AttributeError):
-            raise ValueError("Invalid period format")
+            start_date, end_date = period_bounds(period)
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid period format")
         
         # Get total spent amount
         group_id = owner_id if owner_type == OwnerType.GROUP else None
@@ -162,41 +185,20 @@ class BudgetService:
         remaining_budget = total_budget - total_spent
         usage_percent = (total_spent / total_budget * 100) if total_budget > 0 else 0
         
-        # Get category breakdown
-        from app.domain.models.transaction import Transaction, TransactionType
-        
-        # Get categories with budget (Category.type is stored as string)
-        category_stmt = select(Category).where(
-            and_(
-                Category.budget_amount > 0,
-                Category.type == "EXPENSE"
-            )
+        # Budgeted categories with their spending in one query; for a user,
+        # categories they created
+        breakdown_stmt = (
+            _GROUP_BUDGET_BREAKDOWN if owner_type == OwnerType.GROUP else _USER_BUDGET_BREAKDOWN
         )
+        breakdown_result = await self.session.execute(breakdown_stmt, {
+            "owner_id": owner_id,
+            "start_date": start_date,
+            "end_date": end_date
+        })
         
-        if owner_type == OwnerType.GROUP:
-            category_stmt = category_stmt.where(Category.group_id == owner_id)
-        else:
-            # For user, we need to check created_by or find through group
-            category_stmt = category_stmt.where(Category.created_by == owner_id)
-        
-        category_result = await self.session.execute(category_stmt)
-        categories = category_result.scalars().all()
-        
-        # Get spending per category
         category_breakdown = []
-        for category in categories:
-            # Get transactions for this category in the period
-            tx_stmt = select(func.sum(Transaction.amount)).where(
-                and_(
-                    Transaction.category_id == category.id,
-                    Transaction.type == TransactionType.EXPENSE,
-                    Transaction.date >= start_date,
-                    Transaction.date <= end_date
-                )
-            )
-            
-            tx_result = await self.session.execute(tx_stmt)
-            spent = int(tx_result.scalar_one() or 0)
+        for category in breakdown_result:
+            spent = int(category.spent)
             category_budget = int(category.budget_amount or 0)
             remaining = category_budget - spent
             usage = (spent / category_budget * 100) if category_budget > 0 else 0
@@ -3,9 +3,11 @@ Category Service
 Business logic for category management use cases
 """
 
-from typing import Optional
+from typing import Optional, Sequence
+from sqlalchemy import RowMapping
 from app.domain.repositories.category_repository import CategoryRepository
 from app.domain.models.category import Category
+from app.utils.exceptions import ValidationError
 
 
 class CategoryService:
@@ -27,20 +29,38 @@ class CategoryService:
             include_default=include_default
         )
     
+    async def list_categories(
+        self,
+        group_id: Optional[int],
+        type: str,
+        include_default: bool = True
+    ) -> Sequence[RowMapping]:
+        """Get categories by group and type as read-only rows"""
+        return await self.category_repository.list_by_group_and_type_raw(
+            group_id=group_id,
+            type=type,
+            include_default=include_default
+        )
+    
     async def create_category(self, category: Category) -> Category:
         """Create new category"""
-        # Check for duplicate
-        existing = await self.category_repository.find_by_group_and_type(
-            group_id=category.group_id,
-            type=category.type,
-            include_default=False
-        )
-        
-        for cat in existing:
-            if cat.name == category.name and cat.group_id == category.group_id:
-                raise ValueError("Category already exists")
+        # ux_category_name ignores NULL group_id, so personal categories
+        # still need an explicit duplicate check
+        if category.group_id is None:
+            existing = await self.category_repository.find_by_group_and_type(
+                group_id=None,
+                type=category.type,
+                include_default=False
+            )
+            
+            for cat in existing:
+                if cat.name == category.name and cat.group_id is None:
+                    raise ValidationError("Category already exists")
         
-        return await self.category_repository.create(category)
+        created = await self.category_repository.create_if_absent(category)
+        if created is None:
+            raise ValidationError("Category already exists")
+        return created
     
     async def update_category(self, category: Category) -> Category:
         """Update category"""
@@ -50,7 +70,7 @@ class CategoryService:
         """Delete category (only if no transactions use it)"""
         count = await self.category_repository.count_transactions(category_id)
         if count > 0:
-            raise ValueError("Cannot delete category with existing transactions")
+            raise ValidationError("Cannot delete category with existing transactions")
         
         await self.category_repository.delete(category_id)
 
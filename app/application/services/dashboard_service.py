@@ -3,13 +3,16 @@ Dashboard Service
 Business logic for dashboard use cases (optimized monthly stats)
 """
 
+import asyncio
 from typing import Optional
-from datetime import date, datetime, timedelta
+from app.utils.dates import month_bounds
 from app.domain.repositories.statistics_repository import StatisticsRepository
 
 
 class DashboardService:
     """Dashboard service with dependency injection"""
+
+    __slots__ = ("statistics_repository",)
     
     def __init__(self, statistics_repository: StatisticsRepository):
         self.statistics_repository = statistics_repository
@@ -34,36 +37,37 @@ class DashboardService:
             Dictionary with monthly statistics
         """
         # Calculate month date range
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - datetime.timedelta(days=1)
-        else:
-            end_date = date(year, month + 1, 1) - datetime.timedelta(days=1)
-        
-        # Get summary statistics
-        summary = await self.statistics_repository.get_summary_statistics(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start_date,
-            end_date=end_date
-        )
+        start_date, end_date = month_bounds(year, month)
         
-        # Get category breakdown for expenses
-        expense_categories = await self.statistics_repository.get_category_statistics(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start_date,
-            end_date=end_date,
-            transaction_type='EXPENSE'
+        # Per-day totals (feeding both the summary and the daily trend) and
+        # the expense breakdown are independent, so run them concurrently
+        daily_rows, expense_categories = await asyncio.gather(
+            self.statistics_repository.get_daily_summary(
+                user_id=user_id,
+                group_id=group_id,
+                start_date=start_date,
+                end_date=end_date
+            ),
+            self.statistics_repository.get_category_statistics(
+                user_id=user_id,
+                group_id=group_id,
+                start_date=start_date,
+                end_date=end_date,
+                transaction_type='EXPENSE'
+            )
         )
         
-        # Get daily trend
-        daily_trend = await self.statistics_repository.get_daily_trend(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start_date,
-            end_date=end_date
-        )
+        total_income = sum(row['income'] for row in daily_rows)
+        total_expense = sum(row['expense'] for row in daily_rows)
+        daily_trend = [
+            {
+                'date': row['date'],
+                'income': row['income'],
+                'expense': row['expense'],
+                'net_amount': row['income'] - row['expense']
+            }
+            for row in daily_rows
+        ]
         
         # Additional metrics for dashboard (if needed for group transactions)
         # This can be extended based on requirements
@@ -71,10 +75,10 @@ class DashboardService:
         return {
             'year': year,
             'month': month,
-            'total_income': summary['total_income'],
-            'total_expense': summary['total_expense'],
-            'net_amount': summary['net_amount'],
-            'transaction_count': summary['transaction_count'],
+            'total_income': total_income,
+            'total_expense': total_expense,
+            'net_amount': total_income - total_expense,
+            'transaction_count': sum(row['transaction_count'] for row in daily_rows),
             'expense_by_category': expense_categories[:5],  # Top 5 categories
             'daily_trend': daily_trend
         }
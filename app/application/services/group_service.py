@@ -5,9 +5,13 @@ Business logic for group management use cases
 
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional
 from app.domain.repositories.group_repository import GroupRepository
-from app.domain.models.group import Group, GroupInvite
+from app.domain.models.group import Group
+from app.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
+
+_INVITE_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_INVITE_CODE_TTL = timedelta(hours=1)
+_system_random = secrets.SystemRandom()
 
 
 class GroupService:
@@ -32,16 +36,16 @@ class GroupService:
         """Get group by ID"""
         group = await self.group_repository.find_group_by_id(group_id)
         if not group:
-            raise ValueError("Group not found")
+            raise NotFoundError("Group not found")
         return group
     
     async def update_group(self, group_id: int, user_id: int, name: str) -> Group:
         """Update group (only owner can update)"""
         group = await self.group_repository.find_group_by_id(group_id)
         if not group:
-            raise ValueError("Group not found")
+            raise NotFoundError("Group not found")
         if group.owner_id != user_id:
-            raise ValueError("Only group owner can update")
+            raise ForbiddenError("Only group owner can update")
         
         group.name = name
         return await self.group_repository.update_group(group)
@@ -50,51 +54,42 @@ class GroupService:
         """Delete group (only owner can delete)"""
         group = await self.group_repository.find_group_by_id(group_id)
         if not group:
-            raise ValueError("Group not found")
+            raise NotFoundError("Group not found")
         if group.owner_id != user_id:
-            raise ValueError("Only group owner can delete")
+            raise ForbiddenError("Only group owner can delete")
         
         await self.group_repository.delete_group(group_id)
     
-    async def generate_invite_code(self, group_id: int, user_id: int) -> str:
-        """Generate invite code for group"""
+    async def generate_invite_code(self, group_id: int, user_id: int) -> tuple[str, datetime]:
+        """Generate a single-use invite code for group"""
         # Check if user is group owner
         group = await self.group_repository.find_group_by_id(group_id)
         if not group:
-            raise ValueError("Group not found")
+            raise NotFoundError("Group not found")
         if group.owner_id != user_id:
-            raise ValueError("Only group owner can generate invite")
+            raise ForbiddenError("Only group owner can generate invite")
         
         # Generate random code
-        code = ''.join(secrets.choice('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(10))
-        expires_at = datetime.utcnow() + timedelta(hours=24)
+        code = ''.join(_system_random.choices(_INVITE_ALPHABET, k=10))
+        expires_at = datetime.utcnow() + _INVITE_CODE_TTL
         
-        # Create invite
-        invite = await self.group_repository.create_invite(
+        await self.group_repository.create_invite(
             group_id=group_id,
             code=code,
             created_by=user_id,
             expires_at=expires_at
         )
         
-        return code
+        return code, expires_at
     
     async def join_group(self, user_id: int, code: str) -> Group:
         """Join group using invite code"""
-        # Find invite
-        invite = await self.group_repository.find_invite_by_code(code)
-        if not invite:
-            raise ValueError("Invalid invite code")
-        
-        # Check expiration
-        if invite.expires_at < datetime.utcnow():
-            raise ValueError("Invite code expired")
-        
-        # Add user to group
-        await self.group_repository.add_user_to_group(user_id, invite.group_id)
-        
-        # Return group
-        return await self.group_repository.find_group_by_id(invite.group_id)
+        # Consuming the invite and joining commit together; only one caller
+        # can redeem an unexpired code, and a code to a missing group is kept
+        group = await self.group_repository.redeem_invite(code, user_id)
+        if group is None:
+            raise ValidationError("Invalid or expired invite code")
+        return group
     
     async def leave_group(self, user_id: int) -> None:
         """Leave group"""
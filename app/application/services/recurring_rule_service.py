@@ -3,7 +3,7 @@ RecurringRule Service
 Business logic for recurring rule use cases
 """
 
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
@@ -11,10 +11,13 @@ from app.domain.repositories.recurring_rule_repository import RecurringRuleRepos
 from app.domain.models.recurring_rule import RecurringRule, RecurringFrequency
 from app.domain.models.transaction import Transaction, TransactionType
 from app.domain.models.category import Category
+from app.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 
 
 class RecurringRuleService:
     """RecurringRule service with dependency injection"""
+
+    __slots__ = ("recurring_rule_repository",)
     
     def __init__(self, recurring_rule_repository: RecurringRuleRepository):
         self.recurring_rule_repository = recurring_rule_repository
@@ -32,15 +35,29 @@ class RecurringRuleService:
             is_active=is_active
         )
     
+    async def iter_recurring_rules(
+        self,
+        user_id: int,
+        group_id: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> AsyncIterator[RecurringRule]:
+        """Iterate recurring rules with filters without loading them all"""
+        async for rule in self.recurring_rule_repository.stream_all(
+            user_id=user_id,
+            group_id=group_id,
+            is_active=is_active
+        ):
+            yield rule
+    
     async def get_recurring_rule(self, rule_id: int, user_id: int) -> RecurringRule:
         """Get recurring rule by ID"""
         rule = await self.recurring_rule_repository.find_by_id(rule_id)
         if not rule:
-            raise ValueError("Recurring rule not found")
+            raise NotFoundError("Recurring rule not found")
         
         # Check ownership
         if rule.created_by != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
         return rule
     
@@ -51,10 +68,10 @@ class RecurringRuleService:
         """Create new recurring rule"""
         # Validate rule data
         if rule.amount <= 0:
-            raise ValueError("Amount must be positive")
+            raise ValidationError("Amount must be positive")
         
         if rule.start_date > date.today():
-            raise ValueError("Start date cannot be in the future")
+            raise ValidationError("Start date cannot be in the future")
         
         return await self.recurring_rule_repository.create(rule)
     
@@ -67,11 +84,11 @@ class RecurringRuleService:
         """Update recurring rule"""
         rule = await self.recurring_rule_repository.find_by_id(rule_id)
         if not rule:
-            raise ValueError("Recurring rule not found")
+            raise NotFoundError("Recurring rule not found")
         
         # Check ownership
         if rule.created_by != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
         # Update fields
         for key, value in updated_data.items():
@@ -84,11 +101,11 @@ class RecurringRuleService:
         """Delete recurring rule"""
         rule = await self.recurring_rule_repository.find_by_id(rule_id)
         if not rule:
-            raise ValueError("Recurring rule not found")
+            raise NotFoundError("Recurring rule not found")
         
         # Check ownership
         if rule.created_by != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
         await self.recurring_rule_repository.delete(rule_id)
 
@@ -3,13 +3,26 @@ Recurring Scheduler Service
 Business logic for processing recurring rules and generating transactions
 """
 
-from typing import Optional
+import logging
+from typing import Optional, Callable, AsyncIterator
+from functools import lru_cache
 from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, insert
 from sqlalchemy.orm import selectinload
 from app.domain.models.recurring_rule import RecurringRule, RecurringFrequency
 from app.domain.models.transaction import Transaction, TransactionType
+from app.utils.dates import month_bounds
+from app.utils.exceptions import NotFoundError, ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+# Rules loaded per batch by process_recurring_rules
+_RULE_BATCH_SIZE = 200
+
+# Korean weekday names indexed by date.weekday() (0: Monday)
+_WEEK_DAYS = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
 
 
 class RecurringSchedulerService:
@@ -41,43 +54,53 @@ class RecurringSchedulerService:
         if target_date < start_date:
             return False
         
-        day = target_date.day
-        day_of_week = target_date.weekday()  # 0: Monday, 6: Sunday
-        is_weekend = day_of_week >= 5  # Saturday (5) or Sunday (6)
-        is_weekday = not is_weekend
-        
-        if frequency == RecurringFrequency.DAILY:
-            if day_rule == "매일":
-                return True
-            if day_rule == "평일만" and is_weekday:
-                return True
-            if day_rule == "주말만" and is_weekend:
-                return True
-            return False
+        return _parse_day_rule(day_rule, frequency)(target_date)
+    
+    def occurrence_dates(
+        self,
+        day_rule: str,
+        frequency: RecurringFrequency,
+        start_date: date,
+        end_date: date,
+        rule_start_date: date
+    ) -> list[date]:
+        """
+        Dates in [start_date, end_date] on which a rule fires
         
-        elif frequency == RecurringFrequency.WEEKLY:
-            week_days = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
-            day_name = week_days[day_of_week]
-            return day_name in day_rule
-        
-        elif frequency == RecurringFrequency.MONTHLY:
-            if day_rule == "매월 말일":
-                # Check if it's the last day of the month
-                next_month = target_date.replace(day=28) + timedelta(days=4)
-                last_day = (next_month - timedelta(days=next_month.day)).day
-                return day == last_day
-            
-            # "매월 5일" 형태 파싱
-            if day_rule.startswith("매월"):
-                try:
-                    target_day = int(day_rule.replace("매월", "").replace("일", "").strip())
-                    return day == target_day
-                except ValueError:
-                    pass
-            
-            return False
+        Filters the range with the same cached day-rule predicate that
+        should_create_transaction uses, so both share one rule grammar.
+        """
+        start_date = max(start_date, rule_start_date)
+        fires = _parse_day_rule(day_rule, frequency)
+        return [
+            day
+            for day in (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
+            if fires(day)
+        ]
+    
+    async def _rule_batches(self, filters: list) -> AsyncIterator[list[RecurringRule]]:
+        """
+        Rules matching filters in keyset-paginated batches of _RULE_BATCH_SIZE
         
-        return False
+        Each batch is fully read before the caller issues its own queries, so
+        the session's connection is free between batches (a streamed
+        server-side cursor would hold it).
+        """
+        last_id = 0
+        while True:
+            stmt = select(RecurringRule).where(
+                and_(*filters, RecurringRule.id > last_id)
+            ).options(
+                selectinload(RecurringRule.category)
+            ).order_by(RecurringRule.id).limit(_RULE_BATCH_SIZE)
+            
+            rules = (await self.session.execute(stmt)).scalars().all()
+            if not rules:
+                return
+            yield rules
+            if len(rules) < _RULE_BATCH_SIZE:
+                return
+            last_id = rules[-1].id
     
     async def process_recurring_rules(
         self,
@@ -94,7 +117,8 @@ class RecurringSchedulerService:
             user_id: Specific user ID (optional)
         
         Returns:
-            Dictionary with created, skipped, and total counts
+            Dictionary with created, skipped, and total counts and the ids of
+            groups that received new transactions
         """
         if target_date is None:
             target_date = date.today()
@@ -110,7 +134,117 @@ class RecurringSchedulerService:
         if user_id:
             filters.append(RecurringRule.created_by == user_id)
         
-        # Get active recurring rules
+        created_count = 0
+        skipped_count = 0
+        total_count = 0
+        group_ids = set()
+        
+        # Walk active rules in id-ordered batches so memory stays bounded
+        # however many rules are due
+        async for rules in self._rule_batches(filters):
+            total_count += len(rules)
+            
+            # Prefetch rules already generated on the date (ux_tx_rule_date probe)
+            existing_stmt = select(Transaction.source_rule_id).where(
+                and_(
+                    Transaction.date == target_date,
+                    Transaction.source_rule_id.in_([rule.id for rule in rules])
+                )
+            )
+            generated_rule_ids = set((await self.session.execute(existing_stmt)).scalars())
+            
+            rows = []
+            for rule in rules:
+                try:
+                    # Check if transaction should be created
+                    if not self.should_create_transaction(
+                        rule.day_rule,
+                        rule.frequency,
+                        target_date,
+                        rule.start_date
+                    ):
+                        continue
+                    
+                    # Check for existing transaction
+                    if rule.id in generated_rule_ids:
+                        skipped_count += 1
+                        continue
+                    
+                    # Determine transaction type from category
+                    transaction_type = TransactionType.EXPENSE
+                    if rule.category and rule.category.type == "INCOME":
+                        transaction_type = TransactionType.INCOME
+                    
+                    # Queue transaction for the bulk insert
+                    memo = f"{rule.memo or ''} (자동 생성)".strip()
+                    rows.append({
+                        "group_id": rule.group_id,
+                        "owner_user_id": rule.created_by,
+                        "type": transaction_type,
+                        "date": target_date,
+                        "amount": rule.amount,
+                        "category_id": rule.category_id,
+                        "merchant": rule.merchant,
+                        "memo": memo,
+                        "source_rule_id": rule.id
+                    })
+                
+                except Exception:
+                    # Log error but continue processing other rules
+                    logger.exception("Error processing rule %s", rule.id)
+                    continue
+            
+            # Insert the batch's generated transactions in one executemany
+            if rows:
+                await self.session.execute(insert(Transaction), rows)
+                created_count += len(rows)
+                group_ids.update(row["group_id"] for row in rows)
+        
+        if created_count:
+            await self.session.commit()
+        
+        return {
+            "success": True,
+            "created": created_count,
+            "skipped": skipped_count,
+            "total": total_count,
+            "date": target_date.isoformat(),
+            "group_ids": sorted(group_ids - {None})
+        }
+    
+    async def process_recurring_rules_range(
+        self,
+        start_date: date,
+        end_date: date,
+        rule_id: Optional[int] = None,
+        user_id: Optional[int] = None
+    ) -> dict:
+        """
+        Process recurring rules for every date in a range with one rule fetch,
+        one duplicate lookup and one bulk insert
+        
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+            rule_id: Specific rule ID (optional)
+            user_id: Specific user ID (optional)
+        
+        Returns:
+            Dictionary with created, skipped, and total counts and the ids of
+            groups that received new transactions
+        """
+        # Build query filters
+        filters = [
+            RecurringRule.is_active == True,
+            RecurringRule.start_date <= end_date
+        ]
+        
+        if rule_id:
+            filters.append(RecurringRule.id == rule_id)
+        if user_id:
+            filters.append(RecurringRule.created_by == user_id)
+        
+        # Get active recurring rules once for the whole range
         stmt = select(RecurringRule).where(and_(*filters)).options(
             selectinload(RecurringRule.category)
         )
@@ -118,78 +252,63 @@ class RecurringSchedulerService:
         result = await self.session.execute(stmt)
         rules = result.scalars().all()
         
-        created_count = 0
+        if not rules:
+            return {"success": True, "created": 0, "skipped": 0, "total": 0, "group_ids": []}
+        
+        # Prefetch (rule, date) pairs already generated in the range
+        existing_stmt = select(Transaction.source_rule_id, Transaction.date).where(
+            and_(
+                Transaction.source_rule_id.in_([rule.id for rule in rules]),
+                Transaction.date >= start_date,
+                Transaction.date <= end_date
+            )
+        )
+        existing_result = await self.session.execute(existing_stmt)
+        generated = set(existing_result.tuples())
+        
+        rows = []
         skipped_count = 0
         
         for rule in rules:
-            try:
-                # Check if transaction should be created
-                if not self.should_create_transaction(
-                    rule.day_rule,
-                    rule.frequency,
-                    target_date,
-                    rule.start_date
-                ):
-                    continue
-                
-                # Check for existing transaction
-                existing_filters = [
-                    Transaction.owner_user_id == rule.created_by,
-                    Transaction.date == target_date,
-                    Transaction.amount == rule.amount,
-                    Transaction.category_id == rule.category_id,
-                    Transaction.merchant == rule.merchant,
-                ]
-                # Add memo filter if exists
-                if rule.memo:
-                    existing_filters.append(Transaction.memo.like(f"%{rule.memo}%자동 생성%"))
-                else:
-                    existing_filters.append(Transaction.memo.like("%자동 생성%"))
-                
-                existing_stmt = select(Transaction).where(and_(*existing_filters))
-                existing_result = await self.session.execute(existing_stmt)
-                existing = existing_result.scalar_one_or_none()
-                
-                if existing:
+            # Determine transaction type from category
+            transaction_type = TransactionType.EXPENSE
+            if rule.category and rule.category.type == "INCOME":
+                transaction_type = TransactionType.INCOME
+            memo = f"{rule.memo or ''} (자동 생성)".strip()
+            
+            for target_date in self.occurrence_dates(
+                rule.day_rule,
+                rule.frequency,
+                start_date,
+                end_date,
+                rule.start_date
+            ):
+                if (rule.id, target_date) in generated:
                     skipped_count += 1
                     continue
                 
-                # Determine transaction type from category
-                transaction_type = TransactionType.EXPENSE
-                if rule.category and rule.category.type == "INCOME":
-                    transaction_type = TransactionType.INCOME
-                
-                # Create transaction
-                memo = f"{rule.memo or ''} (자동 생성)".strip()
-                
-                transaction = Transaction(
-                    group_id=rule.group_id,
-                    owner_user_id=rule.created_by,
-                    type=transaction_type,
-                    date=target_date,
-                    amount=rule.amount,
-                    category_id=rule.category_id,
-                    merchant=rule.merchant,
-                    memo=memo
-                )
-                
-                self.session.add(transaction)
-                created_count += 1
-                
-            except Exception as e:
-                # Log error but continue processing other rules
-                print(f"Error processing rule {rule.id}: {e}")
-                continue
+                rows.append({
+                    "group_id": rule.group_id,
+                    "owner_user_id": rule.created_by,
+                    "type": transaction_type,
+                    "date": target_date,
+                    "amount": rule.amount,
+                    "category_id": rule.category_id,
+                    "merchant": rule.merchant,
+                    "memo": memo,
+                    "source_rule_id": rule.id
+                })
         
-        # Commit all transactions
-        await self.session.commit()
+        if rows:
+            await self.session.execute(insert(Transaction), rows)
+            await self.session.commit()
         
         return {
             "success": True,
-            "created": created_count,
+            "created": len(rows),
             "skipped": skipped_count,
             "total": len(rules),
-            "date": target_date.isoformat()
+            "group_ids": sorted({row["group_id"] for row in rows} - {None})
         }
     
     async def generate_transaction_from_rule(
@@ -222,23 +341,20 @@ class RecurringSchedulerService:
         rule = result.scalar_one_or_none()
         
         if not rule:
-            raise ValueError("Recurring rule not found or inactive")
+            raise NotFoundError("Recurring rule not found or inactive")
         
-        # Check for existing transaction
-        existing_stmt = select(Transaction).where(
+        # Check for a transaction already generated from this rule on the date
+        existing_stmt = select(Transaction.id).where(
             and_(
-                Transaction.owner_user_id == user_id,
-                Transaction.date == target_date,
-                Transaction.amount == rule.amount,
-                Transaction.category_id == rule.category_id,
-                Transaction.merchant == rule.merchant
+                Transaction.source_rule_id == rule.id,
+                Transaction.date == target_date
             )
         )
         existing_result = await self.session.execute(existing_stmt)
         existing = existing_result.scalar_one_or_none()
         
         if existing:
-            raise ValueError("Transaction already exists for this date")
+            raise ValidationError("Transaction already exists for this date")
         
         # Determine transaction type
         transaction_type = TransactionType.EXPENSE
@@ -256,7 +372,8 @@ class RecurringSchedulerService:
             amount=rule.amount,
             category_id=rule.category_id,
             merchant=rule.merchant,
-            memo=memo
+            memo=memo,
+            source_rule_id=rule.id
         )
         
         self.session.add(transaction)
@@ -265,3 +382,60 @@ class RecurringSchedulerService:
         
         return transaction
 
+
+def _never(target_date: date) -> bool:
+    """Predicate for day rules that never fire"""
+    return False
+
+
+def _is_last_day(target_date: date) -> bool:
+    """Whether target_date is the last day of its month"""
+    return target_date == month_bounds(target_date.year, target_date.month)[1]
+
+
+def _parse_daily(day_rule: str) -> Callable[[date], bool]:
+    """Predicate for a DAILY rule ("매일", "평일만", "주말만")"""
+    if day_rule == "매일":
+        return lambda target_date: True
+    if day_rule == "평일만":
+        return lambda target_date: target_date.weekday() < 5
+    if day_rule == "주말만":
+        return lambda target_date: target_date.weekday() >= 5
+    return _never
+
+
+def _parse_weekly(day_rule: str) -> Callable[[date], bool]:
+    """Predicate for a WEEKLY rule listing weekday names ("월요일, 금요일")"""
+    weekdays = frozenset(i for i, name in enumerate(_WEEK_DAYS) if name in day_rule)
+    return lambda target_date: target_date.weekday() in weekdays
+
+
+def _parse_monthly(day_rule: str) -> Callable[[date], bool]:
+    """Predicate for a MONTHLY rule ("매월 말일", "매월 5일")"""
+    if day_rule == "매월 말일":
+        return _is_last_day
+    
+    # "매월 5일" 형태 파싱
+    if day_rule.startswith("매월"):
+        try:
+            target_day = int(day_rule.replace("매월", "").replace("일", "").strip())
+            return lambda target_date: target_date.day == target_day
+        except ValueError:
+            pass
+    
+    return _never
+
+
+# Day-rule parser per frequency
+_DAY_RULE_PARSERS = {
+    RecurringFrequency.DAILY: _parse_daily,
+    RecurringFrequency.WEEKLY: _parse_weekly,
+    RecurringFrequency.MONTHLY: _parse_monthly,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_day_rule(day_rule: str, frequency: RecurringFrequency) -> Callable[[date], bool]:
+    """Parse a day rule once into a predicate over target dates"""
+    parser = _DAY_RULE_PARSERS.get(frequency)
+    return parser(day_rule) if parser else _never
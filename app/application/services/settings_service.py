@@ -3,82 +3,101 @@ Settings Service
 Business logic for user settings
 """
 
-from typing import Optional
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.orm.attributes import set_committed_value
 from app.domain.models.user import User
 from app.schemas.settings import AppSettings, UpdateSettingsRequest, DEFAULT_SETTINGS
 
 
+def _merge_patch(target: dict, patch: dict) -> dict:
+    """Apply a JSON merge patch (RFC 7386), mirroring MySQL JSON_MERGE_PATCH"""
+    merged = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict):
+            current = merged.get(key)
+            merged[key] = _merge_patch(current if isinstance(current, dict) else {}, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _fields_set(model: BaseModel) -> dict:
+    """Only the fields the client sent, nested models included (no serializer walk)"""
+    return {
+        key: _fields_set(value) if isinstance(value, BaseModel) else value
+        for key in model.model_fields_set
+        for value in (getattr(model, key),)
+    }
+
+
+def _with_defaults(stored: dict) -> dict:
+    """Stored (possibly partial) settings merged over the defaults"""
+    return {
+        **DEFAULT_SETTINGS,
+        **stored,
+        'category_display': {
+            **DEFAULT_SETTINGS['category_display'],
+            **(stored.get('category_display') or {})
+        }
+    }
+
+
+# Plain-dict defaults (orjson does not encode mapping proxies), built once
+_DEFAULT_RESPONSE = _with_defaults({})
+
+
 class SettingsService:
     """Settings service with dependency injection"""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_settings(self, user_id: int) -> dict:
-        """Get user settings"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise ValueError("User not found")
-
+    async def get_settings(self, user: User) -> dict:
+        """Get settings of the (already loaded) user"""
         # Return settings or default
         if user.settings:
-            # Merge with defaults to ensure all keys exist
-            merged_settings = {**DEFAULT_SETTINGS, **user.settings}
-            return merged_settings
-        
-        return DEFAULT_SETTINGS
+            # Merge with defaults to ensure all keys (nested ones included) exist
+            return _with_defaults(user.settings)
 
-    async def update_settings(self, user_id: int, updates: UpdateSettingsRequest) -> dict:
-        """Update user settings"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        return _DEFAULT_RESPONSE
 
-        if not user:
-            raise ValueError("User not found")
-
-        # Get current settings
-        current_settings = user.settings or DEFAULT_SETTINGS.copy()
-
-        # Update settings
-        update_dict = updates.model_dump(exclude_unset=True)
+    async def update_settings(self, user: User, updates: UpdateSettingsRequest) -> dict:
+        """
+        Update settings of the (already loaded) user
         
-        # Handle nested category_display
-        if 'category_display' in update_dict and update_dict['category_display'] is not None:
-            if 'category_display' not in current_settings:
-                current_settings['category_display'] = DEFAULT_SETTINGS['category_display'].copy()
-            
-            category_updates = update_dict.pop('category_display')
-            current_settings['category_display'].update(category_updates.model_dump(exclude_unset=True))
-
-        # Update other settings
-        current_settings.update(update_dict)
-
-        # Save to database
-        user.settings = current_settings
+        Only the fields sent are written, merged into the stored JSON by a
+        single UPDATE with JSON_MERGE_PATCH; a null value drops the key so
+        it falls back to its default.
+        """
+        patch = _fields_set(updates)
+        stored = _merge_patch(user.settings or {}, patch)
+
+        stmt = update(User).where(User.id == user.id).values(
+            settings=func.json_merge_patch(
+                func.coalesce(User.settings, func.json_object()),
+                orjson.dumps(patch).decode()
+            )
+        ).execution_options(synchronize_session=False)
+        await self.session.execute(stmt)
         await self.session.commit()
-        await self.session.refresh(user)
-
-        return current_settings
 
-    async def reset_settings(self, user_id: int) -> dict:
-        """Reset settings to default"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        # Keep the loaded user in step with the row without another SELECT
+        set_committed_value(user, 'settings', stored)
 
-        if not user:
-            raise ValueError("User not found")
+        return _with_defaults(stored)
 
+    async def reset_settings(self, user: User) -> dict:
+        """Reset settings of the (already loaded) user to default"""
         # Reset to default
         user.settings = None
         await self.session.commit()
-        await self.session.refresh(user)
 
-        return DEFAULT_SETTINGS
+        return _DEFAULT_RESPONSE
 
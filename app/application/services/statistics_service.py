@@ -3,13 +3,42 @@ Statistics Service
 Business logic for statistics use cases
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Optional
-from datetime import datetime, date, timedelta
+from datetime import date
 from app.domain.repositories.statistics_repository import StatisticsRepository
+from app.utils.dates import month_bounds
+
+
+@lru_cache(maxsize=64)
+def _period_range(period: str, today: date) -> tuple[date, date]:
+    """Date range for a named period, computed once per (period, day)"""
+    year, month = today.year, today.month
+    month_start, month_end = month_bounds(year, month)
+
+    if period == 'last-month':
+        return month_bounds(year - 1, 12) if month == 1 else month_bounds(year, month - 1)
+
+    elif period == 'last-3-months':
+        start_year, start_month = (year - 1, month + 9) if month <= 3 else (year, month - 2)
+        return month_bounds(start_year, start_month)[0], month_end
+
+    elif period == 'last-6-months':
+        start_year, start_month = (year - 1, month + 6) if month <= 6 else (year, month - 5)
+        return month_bounds(start_year, start_month)[0], month_end
+
+    elif period == 'year':
+        return date(year, 1, 1), date(year, 12, 31)
+
+    # 'current-month' and the default
+    return month_start, month_end
 
 
 class StatisticsService:
     """Statistics service with dependency injection"""
+
+    __slots__ = ("statistics_repository",)
     
     def __init__(self, statistics_repository: StatisticsRepository):
         self.statistics_repository = statistics_repository
@@ -31,69 +60,11 @@ class StatisticsService:
         Returns:
             Tuple of (start_date, end_date)
         """
-        today = date.today()
-        
         # Custom date range takes precedence
         if start_date and end_date:
             return start_date, end_date
         
-        # Calculate based on period
-        if period == 'current-month':
-            start = date(today.year, today.month, 1)
-            if today.month == 12:
-                end = date(today.year + 1, 1, 1)
-            else:
-                end = date(today.year, today.month + 1, 1)
-            end = end.replace(day=1) - timedelta(days=1)
-            return start, end
-        
-        elif period == 'last-month':
-            if today.month == 1:
-                start = date(today.year - 1, 12, 1)
-                end = date(today.year, 1, 1) - timedelta(days=1)
-            else:
-                start = date(today.year, today.month - 1, 1)
-                end = date(today.year, today.month, 1) - timedelta(days=1)
-            return start, end
-        
-        elif period == 'last-3-months':
-            if today.month <= 3:
-                start = date(today.year - 1, today.month + 9, 1)
-            else:
-                start = date(today.year, today.month - 2, 1)
-            if today.month == 12:
-                end = date(today.year + 1, 1, 1)
-            else:
-                end = date(today.year, today.month + 1, 1)
-            end = end.replace(day=1) - timedelta(days=1)
-            return start, end
-        
-        elif period == 'last-6-months':
-            if today.month <= 6:
-                start = date(today.year - 1, today.month + 6, 1)
-            else:
-                start = date(today.year, today.month - 5, 1)
-            if today.month == 12:
-                end = date(today.year + 1, 1, 1)
-            else:
-                end = date(today.year, today.month + 1, 1)
-            end = end.replace(day=1) - timedelta(days=1)
-            return start, end
-        
-        elif period == 'year':
-            start = date(today.year, 1, 1)
-            end = date(today.year, 12, 31)
-            return start, end
-        
-        else:
-            # Default: current month
-            start = date(today.year, today.month, 1)
-            if today.month == 12:
-                end = date(today.year + 1, 1, 1)
-            else:
-                end = date(today.year, today.month + 1, 1)
-            end = end.replace(day=1) - timedelta(days=1)
-            return start, end
+        return _period_range(period, date.today())
     
     async def get_statistics(
         self,
@@ -112,47 +83,34 @@ class StatisticsService:
         # Calculate date range
         start, end = self.calculate_date_range(period, start_date, end_date)
         
-        # Get all statistics in parallel
-        summary = await self.statistics_repository.get_summary_statistics(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start,
-            end_date=end
-        )
-        
-        income_categories = await self.statistics_repository.get_category_statistics(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start,
-            end_date=end,
-            transaction_type='INCOME'
-        )
-        
-        expense_categories = await self.statistics_repository.get_category_statistics(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start,
-            end_date=end,
-            transaction_type='EXPENSE'
+        # The reads are independent, so run them concurrently; income and
+        # expense categories come from one GROUP BY category, type query
+        summary, categories, daily_trend, monthly_comparison = await asyncio.gather(
+            self.statistics_repository.get_summary_statistics(
+                user_id=user_id,
+                group_id=group_id,
+                start_date=start,
+                end_date=end
+            ),
+            self.statistics_repository.get_category_statistics_both(
+                user_id=user_id,
+                group_id=group_id,
+                start_date=start,
+                end_date=end
+            ),
+            self.statistics_repository.get_daily_trend(
+                user_id=user_id,
+                group_id=group_id,
+                start_date=start,
+                end_date=end
+            ),
+            self.statistics_repository.get_monthly_comparison(
+                user_id=user_id,
+                group_id=group_id,
+                months=6
+            )
         )
         
-        daily_trend = await self.statistics_repository.get_daily_trend(
-            user_id=user_id,
-            group_id=group_id,
-            start_date=start,
-            end_date=end
-        )
-        
-        monthly_comparison = await self.statistics_repository.get_monthly_comparison(
-            user_id=user_id,
-            group_id=group_id,
-            months=6
-        )
-        
-        # Sort categories by amount (descending)
-        income_categories.sort(key=lambda x: x['total_amount'], reverse=True)
-        expense_categories.sort(key=lambda x: x['total_amount'], reverse=True)
-        
         return {
             'period': period,
             'date_range': {
@@ -161,8 +119,9 @@ class StatisticsService:
             },
             'summary': summary,
             'category_breakdown': {
-                'income': income_categories,
-                'expense': expense_categories
+                # Already ordered by amount (descending) in SQL
+                'income': categories['INCOME'],
+                'expense': categories['EXPENSE']
             },
             'monthly_comparison': monthly_comparison,
             'daily_trend': daily_trend
@@ -3,11 +3,16 @@ Transaction Service
 Business logic for transaction use cases
 """
 
-from typing import Optional
+from typing import Optional, AsyncIterator
 from datetime import datetime
 from app.domain.repositories.transaction_repository import TransactionRepository
 from app.domain.models.transaction import Transaction
 from app.domain.models.category import Category
+from app.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
+
+
+# Columns that reject NULL, so updates skip explicit nulls for them
+_REQUIRED_FIELDS = frozenset({"type", "date", "amount"})
 
 
 class TransactionService:
@@ -33,7 +38,8 @@ class TransactionService:
         Returns:
             (transactions, total_count)
         """
-        transactions = await self.transaction_repository.find_all(
+        # Page and total come back from one windowed query
+        transactions, total_count = await self.transaction_repository.find_all_with_count(
             group_id=group_id,
             user_id=user_id,
             start_date=start_date,
@@ -44,22 +50,33 @@ class TransactionService:
             offset=offset
         )
         
-        total_count = await self.transaction_repository.count_total(
+        return transactions, total_count
+    
+    async def iter_transactions(
+        self,
+        group_id: Optional[int],
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        category_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> AsyncIterator[Transaction]:
+        """Iterate all matching transactions without loading them all"""
+        async for transaction in self.transaction_repository.stream_all(
             group_id=group_id,
             user_id=user_id,
             start_date=start_date,
             end_date=end_date,
             category_id=category_id,
             search=search
-        )
-        
-        return transactions, total_count
+        ):
+            yield transaction
     
     async def create_transaction(self, transaction: Transaction) -> Transaction:
         """Create new transaction"""
         # Validate transaction data
         if transaction.amount <= 0:
-            raise ValueError("Amount must be positive")
+            raise ValidationError("Amount must be positive")
         
         return await self.transaction_repository.create(transaction)
     
@@ -67,11 +84,11 @@ class TransactionService:
         """Get transaction by ID"""
         transaction = await self.transaction_repository.find_by_id(transaction_id)
         if not transaction:
-            raise ValueError("Transaction not found")
+            raise NotFoundError("Transaction not found")
         
         # Check ownership
         if transaction.owner_user_id != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
         return transaction
     
@@ -84,14 +101,16 @@ class TransactionService:
         """Update transaction"""
         transaction = await self.transaction_repository.find_by_id(transaction_id)
         if not transaction:
-            raise ValueError("Transaction not found")
+            raise NotFoundError("Transaction not found")
         
         # Check ownership
         if transaction.owner_user_id != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
-        # Update fields
+        # Update fields; null cannot clear a required column
         for key, value in updated_data.items():
+            if value is None and key in _REQUIRED_FIELDS:
+                continue
             if hasattr(transaction, key):
                 setattr(transaction, key, value)
         
@@ -101,11 +120,11 @@ class TransactionService:
         """Delete transaction"""
         transaction = await self.transaction_repository.find_by_id(transaction_id)
         if not transaction:
-            raise ValueError("Transaction not found")
+            raise NotFoundError("Transaction not found")
         
         # Check ownership
         if transaction.owner_user_id != user_id:
-            raise ValueError("Unauthorized")
+            raise ForbiddenError("Unauthorized")
         
         await self.transaction_repository.delete(transaction_id)
 
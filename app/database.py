@@ -3,7 +3,9 @@ Database Configuration
 SQLAlchemy 2.0+ with Async
 """
 
-from sqlalchemy import create_engine
+import asyncio
+import logging
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from app.config import settings
@@ -14,15 +16,78 @@ class Base(DeclarativeBase):
     pass
 
 
+logger = logging.getLogger(__name__)
+
+
 # Create async engine
+# Pool sizing: get_balance fans out up to 5 concurrent reads, each on its own
+# pooled connection, on top of the request session. Keep
+# pool_size + max_overflow >= (queries per request) x (concurrent requests),
+# otherwise the gathered queries queue up on checkout and run serially again.
 engine = create_async_engine(
     settings.database_url.replace("mysql+pymysql", "mysql+aiomysql"),
-    echo=True,
+    echo=settings.debug,
     future=True,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    # Pre-ping costs a round trip per checkout. Without it, recycling keeps
+    # connections under the server's idle timeout, and a disconnect error
+    # invalidates the pool so only connections already checked out fail
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle,
+    # Room for every query shape (filter combinations included) so hot
+    # statements reuse their compiled form instead of recompiling
+    query_cache_size=settings.db_query_cache_size,
 )
 
+# Connection pool pressure counters
+pool_stats = {
+    "checkouts": 0,
+    "overflow_checkouts": 0,
+    "saturated_checkouts": 0,
+}
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _track_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    """Count checkouts beyond pool_size and those that exhaust the pool"""
+    pool = engine.sync_engine.pool
+    checked_out = pool.checkedout()
+    pool_stats["checkouts"] += 1
+
+    if checked_out > pool.size():
+        pool_stats["overflow_checkouts"] += 1
+
+    if checked_out >= pool.size() + settings.db_max_overflow:
+        # Any further checkout waits for a connection to be returned
+        pool_stats["saturated_checkouts"] += 1
+        logger.warning(
+            "db_pool_saturated",
+            extra={
+                "checked_out": checked_out,
+                "pool_size": pool.size(),
+                "max_overflow": settings.db_max_overflow,
+                **pool_stats,
+            },
+        )
+
+
+async def _open_pooled_connection() -> None:
+    """Check out one connection and return it to the pool"""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def warm_up_pool() -> None:
+    """Open pool_size connections up front so the first requests skip connect and auth"""
+    try:
+        # Concurrent checkouts force distinct connections into the pool
+        await asyncio.gather(*(_open_pooled_connection() for _ in range(settings.db_pool_size)))
+    except Exception:
+        logger.warning("db_pool_warm_up_failed", exc_info=True)
+
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -38,10 +103,15 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+async def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get session factory for services that run independent queries concurrently"""
+    return async_session_maker
+
+
 # Legacy sync engine (for Alembic)
 sync_engine = create_engine(
     settings.database_url,
-    echo=True,
+    echo=settings.debug,
     pool_pre_ping=True,
 )
 
@@ -7,7 +7,7 @@ from fastapi import Depends, HTTPException, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_session
 from app.domain.models.user import User
-from app.application.factories.token_factory import TokenFactory
+from app.application.factories.token_factory import get_user_from_token
 from app.application.services.auth_service import AuthService
 from app.application.services.group_service import GroupService
 from app.application.services.transaction_service import TransactionService
@@ -15,10 +15,6 @@ from app.infrastructure.repositories.auth_repository_impl import AuthRepositoryI
 from app.infrastructure.repositories.group_repository_impl import GroupRepositoryImpl
 
 
-# Token Factory
-token_factory = TokenFactory()
-
-
 async def get_db() -> AsyncSession:
     """Get database session"""
     async for session in get_session():
@@ -27,33 +23,29 @@ async def get_db() -> AsyncSession:
 
 async def get_current_user(
     authorization: str = Header(..., description="Bearer token"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_session)
 ) -> User:
     """
     Get current authenticated user from JWT token
     
-    Dependency: Requires valid access token
+    Dependency: Requires valid access token. The user is loaded into the
+    request session (shared with services that depend on get_session), so
+    later session.get(User, id) calls hit the identity map.
     """
-    # Extract token from Authorization header
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid authentication scheme")
-    except ValueError:
+    # Extract token from Authorization header ("Bearer <token>") without splitting
+    if authorization[:7].lower() != "bearer ":
+        raise HTTPException(status_code=401, detail="Invalid authentication scheme")
+    token = authorization[7:].strip()
+    if not token or " " in token:
         raise HTTPException(status_code=401, detail="Invalid authorization header")
     
     try:
         # Verify token
-        payload = token_factory.get_user_from_token(token, "access")
-        user_id = int(payload["sub"])
-        
-        # Get user from database
-        from app.domain.models.user import User
-        from sqlalchemy import select
+        payload = get_user_from_token(token, "access")
+        user_id = payload["sub"]
         
-        stmt = select(User).where(User.id == user_id)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        # Get user from database (identity map first)
+        user = await db.get(User, user_id)
         
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
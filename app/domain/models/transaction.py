@@ -4,7 +4,7 @@ Transaction Model
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import BigInteger, String, Date, DateTime, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import BigInteger, String, Date, DateTime, ForeignKey, Enum as SQLEnum, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 from app.domain.models.base import TimestampMixin
@@ -52,6 +52,12 @@ class Transaction(Base, TimestampMixin):
     )
     merchant: Mapped[Optional[str]] = mapped_column(String(160), nullable=True)
     memo: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    # Recurring rule that generated this transaction (NULL for manual entries)
+    source_rule_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        ForeignKey("recurring_rules.id", ondelete="SET NULL"),
+        nullable=True
+    )
     
     # Relationships
     owner: Mapped["User"] = relationship(
@@ -80,5 +86,8 @@ class Transaction(Base, TimestampMixin):
         Index("idx_tx_owner_date", "owner_user_id", "date"),
         Index("idx_tx_category", "category_id"),
         Index("idx_tx_tag", "tag_id"),
+        # One generated transaction per rule and date; NULLs (manual
+        # entries) never collide
+        UniqueConstraint("source_rule_id", "date", name="ux_tx_rule_date"),
     )
 
@@ -25,6 +25,15 @@ class AuthRepository(Protocol):
         """Update user information"""
         ...
     
+    async def update_user_with_email_check(
+        self,
+        user_id: int,
+        nickname: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> bool:
+        """Update profile fields unless the new email belongs to another user"""
+        ...
+    
     async def verify_user_password(self, email: str, password_hash: str) -> Optional[User]:
         """Verify user credentials"""
         ...
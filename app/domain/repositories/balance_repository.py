@@ -42,3 +42,11 @@ class BalanceRepository(Protocol):
         """Get monthly balance trend"""
         ...
 
+    async def compute_balance_bundle(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        months: int = 6
+    ) -> tuple[int, list[dict]]:
+        """Get current balance and monthly trend in one query"""
+        ...
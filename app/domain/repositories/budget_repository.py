@@ -2,7 +2,8 @@
 Budget Repository Interface
 """
 
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Sequence
+from sqlalchemy import RowMapping
 from app.domain.models.budget import Budget, OwnerType, BudgetStatus
 
 
@@ -13,6 +14,15 @@ class BudgetRepository(Protocol):
         """Find budget by ID"""
         ...
     
+    async def find_owned(
+        self,
+        budget_id: int,
+        owner_type: OwnerType,
+        owner_id: int
+    ) -> Optional[Budget]:
+        """Find budget by ID if it belongs to the owner"""
+        ...
+    
     async def find_by_owner_and_period(
         self,
         owner_type: OwnerType,
@@ -26,11 +36,24 @@ class BudgetRepository(Protocol):
         self,
         owner_type: Optional[OwnerType] = None,
         owner_id: Optional[int] = None,
-        status: Optional[BudgetStatus] = None
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Budget]:
         """Find all budgets with filters"""
         ...
     
+    async def list_budgets_raw(
+        self,
+        owner_type: Optional[OwnerType] = None,
+        owner_id: Optional[int] = None,
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Sequence[RowMapping]:
+        """Find budgets with filters as column mappings"""
+        ...
+    
     async def create(self, budget: Budget) -> Budget:
         """Create new budget"""
         ...
@@ -39,7 +62,20 @@ class BudgetRepository(Protocol):
         """Update budget"""
         ...
     
+    async def upsert(self, budget: Budget) -> Budget:
+        """Create budget, or update amount and status of the owner's budget for the period"""
+        ...
+    
     async def delete(self, budget_id: int) -> None:
         """Delete budget"""
         ...
+    
+    async def delete_if_owned(
+        self,
+        budget_id: int,
+        owner_type: OwnerType,
+        owner_id: int
+    ) -> int:
+        """Delete budget if it belongs to the owner, returning the deleted row count"""
+        ...
 
@@ -2,7 +2,8 @@
 Category Repository Interface
 """
 
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Sequence
+from sqlalchemy import RowMapping
 from app.domain.models.category import Category
 
 
@@ -22,10 +23,23 @@ class CategoryRepository(Protocol):
         """Find categories by group and type"""
         ...
     
+    async def list_by_group_and_type_raw(
+        self,
+        group_id: Optional[int],
+        type: str,
+        include_default: bool = True
+    ) -> Sequence[RowMapping]:
+        """Find categories by group and type as column mappings"""
+        ...
+    
     async def create(self, category: Category) -> Category:
         """Create new category"""
         ...
     
+    async def create_if_absent(self, category: Category) -> Optional[Category]:
+        """Create new category, or return None if the unique name key already exists"""
+        ...
+    
     async def update(self, category: Category) -> Category:
         """Update category"""
         ...
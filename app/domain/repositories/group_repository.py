@@ -33,8 +33,8 @@ class GroupRepository(Protocol):
         """Create group invite code"""
         ...
     
-    async def find_invite_by_code(self, code: str) -> Optional[GroupInvite]:
-        """Find invite by code"""
+    async def redeem_invite(self, code: str, user_id: int) -> Optional[Group]:
+        """Consume an unexpired invite and join its group; returns the group (None if invalid)"""
         ...
     
     async def add_user_to_group(self, user_id: int, group_id: int) -> None:
@@ -2,13 +2,15 @@
 RecurringRule Repository Interface
 """
 
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, AsyncIterator
 from datetime import date
 from app.domain.models.recurring_rule import RecurringRule
 
 
 class RecurringRuleRepository(Protocol):
     """RecurringRule repository interface"""
+
+    __slots__ = ()
     
     async def find_by_id(self, rule_id: int) -> Optional[RecurringRule]:
         """Find recurring rule by ID"""
@@ -23,6 +25,15 @@ class RecurringRuleRepository(Protocol):
         """Find all recurring rules with filters"""
         ...
     
+    def stream_all(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> AsyncIterator[RecurringRule]:
+        """Stream recurring rules with filters"""
+        ...
+    
     async def create(self, rule: RecurringRule) -> RecurringRule:
         """Create new recurring rule"""
         ...
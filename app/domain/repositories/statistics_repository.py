@@ -9,6 +9,8 @@ from datetime import datetime, date
 class StatisticsRepository(Protocol):
     """Statistics repository interface"""
 
+    __slots__ = ()
+
     async def get_category_statistics(
         self,
         user_id: int,
@@ -20,6 +22,12 @@ class StatisticsRepository(Protocol):
         """Get category-based statistics"""
         ...
 
+    async def get_category_statistics_both(
+        self, user_id: int, group_id: Optional[int], start_date: date, end_date: date
+    ) -> dict:
+        """Get income and expense category statistics keyed by type"""
+        ...
+
     async def get_summary_statistics(
         self, user_id: int, group_id: Optional[int], start_date: date, end_date: date
     ) -> dict:
@@ -32,6 +40,12 @@ class StatisticsRepository(Protocol):
         """Get daily trend data"""
         ...
 
+    async def get_daily_summary(
+        self, user_id: int, group_id: Optional[int], start_date: date, end_date: date
+    ) -> List[dict]:
+        """Get per-day income, expense and transaction count"""
+        ...
+
     async def get_monthly_comparison(
         self, user_id: int, group_id: Optional[int], months: int = 6
     ) -> List[dict]:
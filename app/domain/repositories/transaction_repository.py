@@ -2,7 +2,7 @@
 Transaction Repository Interface
 """
 
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, AsyncIterator
 from datetime import datetime
 from app.domain.models.transaction import Transaction
 
@@ -28,6 +28,20 @@ class TransactionRepository(Protocol):
         """Find transactions with filters and pagination"""
         ...
     
+    async def find_all_with_count(
+        self,
+        group_id: Optional[int],
+        user_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category_id: Optional[int],
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> tuple[list[Transaction], int]:
+        """Find a page of transactions together with the filtered total"""
+        ...
+    
     async def count_total(
         self,
         group_id: Optional[int],
@@ -40,6 +54,18 @@ class TransactionRepository(Protocol):
         """Count total transactions with filters"""
         ...
     
+    def stream_all(
+        self,
+        group_id: Optional[int],
+        user_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category_id: Optional[int],
+        search: Optional[str] = None
+    ) -> AsyncIterator[Transaction]:
+        """Stream all transactions matching the filters"""
+        ...
+    
     async def create(self, transaction: Transaction) -> Transaction:
         """Create new transaction"""
         ...
@@ -5,7 +5,7 @@ ORM-based repository for authentication
 
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update, exists
 from app.domain.models.user import User
 from app.domain.repositories.auth_repository import AuthRepository
 
@@ -23,10 +23,8 @@ class AuthRepositoryImpl(AuthRepository):
         return result.scalar_one_or_none()
     
     async def find_user_by_id(self, user_id: int) -> Optional[User]:
-        """Find user by ID using ORM query"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        """Find user by ID (identity map first, PK select on miss)"""
+        return await self.session.get(User, user_id)
     
     async def create_user(self, email: str, password_hash: str, nickname: str) -> User:
         """Create new user with ORM"""
@@ -47,6 +45,37 @@ class AuthRepositoryImpl(AuthRepository):
         await self.session.refresh(user)
         return user
     
+    async def update_user_with_email_check(
+        self,
+        user_id: int,
+        nickname: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> bool:
+        """Update profile in one statement; False if the email is taken by another user"""
+        values = {}
+        if nickname:
+            values["nickname"] = nickname
+        if email:
+            values["email"] = email
+        if not values:
+            return True
+        
+        stmt = update(User).where(User.id == user_id).values(**values)
+        if email:
+            # MySQL cannot reference the UPDATE target in a subquery directly,
+            # so the duplicate lookup goes through a materialized derived table
+            duplicate = (
+                select(User.id)
+                .where(User.email == email, User.id != user_id)
+                .limit(1)
+                .subquery("duplicate")
+            )
+            stmt = stmt.where(~exists(select(duplicate.c.id)))
+        
+        result = await self.session.execute(stmt.execution_options(synchronize_session=False))
+        await self.session.commit()
+        return result.rowcount > 0
+    
     async def verify_user_password(self, email: str, password_hash: str) -> Optional[User]:
         """Verify user credentials"""
         # This is handled by service layer with password_hasher
@@ -3,10 +3,11 @@ Balance Repository Implementation
 SQLAlchemy implementation of balance repository
 """
 
-from typing import Optional
+from typing import Optional, AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date, timedelta
 from sqlalchemy import select, func, and_, case
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 from app.domain.repositories.balance_repository import BalanceRepository
 from app.domain.models.transaction import Transaction, TransactionType
@@ -15,8 +16,27 @@ from app.domain.models.transaction import Transaction, TransactionType
 class BalanceRepositoryImpl:
     """SQLAlchemy implementation of BalanceRepository"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    ):
         self.session = session
+        self.session_factory = session_factory
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[AsyncSession]:
+        """
+        Session for read-only queries
+
+        With a session factory each read gets its own short-lived session
+        (and pooled connection), so reads can be awaited concurrently.
+        """
+        if self.session_factory is None:
+            yield self.session
+        else:
+            async with self.session_factory() as session:
+                yield session
 
     async def calculate_balance(
         self,
@@ -52,7 +72,8 @@ class BalanceRepositoryImpl:
             )
         ).where(and_(*filters) if filters else True)
 
-        result = await self.session.execute(stmt)
+        async with self._reader() as session:
+            result = await session.execute(stmt)
         balance = result.scalar() or 0
         return int(balance)
 
@@ -78,7 +99,8 @@ class BalanceRepositoryImpl:
             filters.append(Transaction.date <= end_date)
 
         stmt = select(func.sum(Transaction.amount)).where(and_(*filters))
-        result = await self.session.execute(stmt)
+        async with self._reader() as session:
+            result = await session.execute(stmt)
         total = result.scalar() or 0
         return int(total)
 
@@ -112,8 +134,9 @@ class BalanceRepositoryImpl:
             )
         )
         
-        result = await self.session.execute(stmt)
-        transactions = result.scalars().all()
+        async with self._reader() as session:
+            result = await session.execute(stmt)
+            transactions = result.scalars().all()
 
         # Group by month
         monthly_data: dict[str, dict] = {}
@@ -138,32 +161,105 @@ class BalanceRepositoryImpl:
                 monthly_data[month_key]['expense'] += amount
                 monthly_data[month_key]['balance'] -= amount
 
-        # Convert to list and sort by month
-        trend_list = sorted(monthly_data.values(), key=lambda x: x['month'])
+        return _fill_monthly_trend(monthly_data, start_date, end_date, months)
+
+    async def compute_balance_bundle(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        months: int = 6
+    ) -> tuple[int, list[dict]]:
+        """
+        Current balance and monthly trend from a single aggregation
+
+        Transactions are summed per month in one scan; the current balance is
+        the total over all rows, while the trend columns only count rows
+        dated within the trend window, as get_monthly_trend does.
+        """
+        end_date = date.today()
+        start_date = end_date - timedelta(days=months * 30)
+
+        filters = []
+        if user_id:
+            filters.append(Transaction.owner_user_id == user_id)
+        if group_id:
+            filters.append(Transaction.group_id == group_id)
+
+        year = func.year(Transaction.date)
+        month = func.month(Transaction.date)
+        is_income = Transaction.type == TransactionType.INCOME
+        in_window = Transaction.date.between(start_date, end_date)
+        stmt = (
+            select(
+                year.label('year'),
+                month.label('month'),
+                func.sum(
+                    case((is_income, Transaction.amount), else_=-Transaction.amount)
+                ).label('balance'),
+                func.sum(
+                    case((and_(in_window, is_income), Transaction.amount), else_=0)
+                ).label('income'),
+                func.sum(
+                    case((and_(in_window, ~is_income), Transaction.amount), else_=0)
+                ).label('expense')
+            )
+            .where(and_(*filters) if filters else True)
+            .group_by(year, month)
+        )
+
+        async with self._reader() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        current_balance = 0
+        monthly_data: dict[str, dict] = {}
+        trend_start = start_date.strftime('%Y-%m')
+        for row in rows:
+            current_balance += int(row.balance or 0)
+            month_key = f"{row.year:04d}-{row.month:02d}"
+            if month_key >= trend_start:
+                income = int(row.income or 0)
+                expense = int(row.expense or 0)
+                monthly_data[month_key] = {
+                    'month': month_key,
+                    'balance': income - expense,
+                    'income': income,
+                    'expense': expense
+                }
+
+        return current_balance, _fill_monthly_trend(monthly_data, start_date, end_date, months)
+
+
+def _fill_monthly_trend(
+    monthly_data: dict[str, dict],
+    start_date: date,
+    end_date: date,
+    months: int
+) -> list[dict]:
+    """Order monthly totals and fill months without transactions with zero"""
+    # Fill missing months with zero
+    result_list = []
+    current = start_date.replace(day=1)
+    
+    while current <= end_date:
+        month_key = current.strftime('%Y-%m')
         
-        # Fill missing months with zero
-        result_list = []
-        current = start_date.replace(day=1)
+        if month_key in monthly_data:
+            result_list.append(monthly_data[month_key])
+        else:
+            result_list.append({
+                'month': month_key,
+                'balance': 0,
+                'income': 0,
+                'expense': 0
+            })
         
-        while current <= end_date:
-            month_key = current.strftime('%Y-%m')
-            
-            if month_key in monthly_data:
-                result_list.append(monthly_data[month_key])
-            else:
-                result_list.append({
-                    'month': month_key,
-                    'balance': 0,
-                    'income': 0,
-                    'expense': 0
-                })
-            
-            # Move to next month
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # Move to next month
+        if current.month == 12:
+            current = current.replace(year=current.year + 1, month=1)
+        else:
+            current = current.replace(month=current.month + 1)
 
-        # Return only last N months
-        return result_list[-months:] if len(result_list) > months else result_list
+    # Return only last N months
+    return result_list[-months:] if len(result_list) > months else result_list
 
@@ -3,12 +3,48 @@ Budget Repository Implementation
 ORM-based repository for budgets
 """
 
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, delete, func, and_, Select, RowMapping
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from app.domain.models.budget import Budget, OwnerType, BudgetStatus
 from app.domain.repositories.budget_repository import BudgetRepository
 
+# Columns serialized by the budget list endpoint
+_BUDGET_COLUMNS = (
+    Budget.id, Budget.owner_type, Budget.owner_id, Budget.period,
+    Budget.total_amount, Budget.status, Budget.created_at, Budget.updated_at
+)
+
+
+def _apply_list_filters(
+    stmt: Select,
+    owner_type: Optional[OwnerType],
+    owner_id: Optional[int],
+    status: Optional[BudgetStatus],
+    limit: Optional[int],
+    offset: int
+) -> Select:
+    """Apply owner/status filters, period ordering and pagination"""
+    filters = []
+    if owner_type is not None:
+        filters.append(Budget.owner_type == owner_type)
+    if owner_id is not None:
+        filters.append(Budget.owner_id == owner_id)
+    if status is not None:
+        filters.append(Budget.status == status)
+    
+    if filters:
+        stmt = stmt.where(and_(*filters))
+    
+    # Order by period (descending)
+    stmt = stmt.order_by(Budget.period.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
 
 class BudgetRepositoryImpl(BudgetRepository):
     """SQLAlchemy-based budget repository"""
@@ -22,6 +58,23 @@ class BudgetRepositoryImpl(BudgetRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def find_owned(
+        self,
+        budget_id: int,
+        owner_type: OwnerType,
+        owner_id: int
+    ) -> Optional[Budget]:
+        """Find budget by ID with the ownership check in the WHERE clause"""
+        stmt = select(Budget).where(
+            and_(
+                Budget.id == budget_id,
+                Budget.owner_type == owner_type,
+                Budget.owner_id == owner_id
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def find_by_owner_and_period(
         self,
         owner_type: OwnerType,
@@ -43,28 +96,28 @@ class BudgetRepositoryImpl(BudgetRepository):
         self,
         owner_type: Optional[OwnerType] = None,
         owner_id: Optional[int] = None,
-        status: Optional[BudgetStatus] = None
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Budget]:
         """Find all budgets with filters using ORM"""
-        stmt = select(Budget)
-        
-        filters = []
-        if owner_type is not None:
-            filters.append(Budget.owner_type == owner_type)
-        if owner_id is not None:
-            filters.append(Budget.owner_id == owner_id)
-        if status is not None:
-            filters.append(Budget.status == status)
-        
-        if filters:
-            stmt = stmt.where(and_(*filters))
-        
-        # Order by period (descending)
-        stmt = stmt.order_by(Budget.period.desc())
-        
+        stmt = _apply_list_filters(select(Budget), owner_type, owner_id, status, limit, offset)
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
+    async def list_budgets_raw(
+        self,
+        owner_type: Optional[OwnerType] = None,
+        owner_id: Optional[int] = None,
+        status: Optional[BudgetStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Sequence[RowMapping]:
+        """Find budgets as plain column mappings (no ORM identity map)"""
+        stmt = _apply_list_filters(select(*_BUDGET_COLUMNS), owner_type, owner_id, status, limit, offset)
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+    
     async def create(self, budget: Budget) -> Budget:
         """Create new budget with ORM"""
         self.session.add(budget)
@@ -79,10 +132,49 @@ class BudgetRepositoryImpl(BudgetRepository):
         await self.session.refresh(budget)
         return budget
     
+    async def upsert(self, budget: Budget) -> Budget:
+        """Create or update budget in one INSERT ... ON DUPLICATE KEY UPDATE"""
+        stmt = mysql_insert(Budget).values(
+            owner_type=budget.owner_type,
+            owner_id=budget.owner_id,
+            period=budget.period,
+            total_amount=budget.total_amount,
+            status=budget.status
+        )
+        # LAST_INSERT_ID(id) reports the existing row's id on conflict, and
+        # onupdate defaults are not applied here, so updated_at is explicit
+        stmt = stmt.on_duplicate_key_update(
+            id=func.last_insert_id(Budget.id),
+            total_amount=stmt.inserted.total_amount,
+            status=stmt.inserted.status,
+            updated_at=func.now()
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return await self.session.get(Budget, result.lastrowid, populate_existing=True)
+    
     async def delete(self, budget_id: int) -> None:
         """Delete budget with ORM"""
         budget = await self.find_by_id(budget_id)
         if budget:
             await self.session.delete(budget)
             await self.session.commit()
+    
+    async def delete_if_owned(
+        self,
+        budget_id: int,
+        owner_type: OwnerType,
+        owner_id: int
+    ) -> int:
+        """Delete budget in one statement with the ownership check in the WHERE clause"""
+        stmt = delete(Budget).where(
+            and_(
+                Budget.id == budget_id,
+                Budget.owner_type == owner_type,
+                Budget.owner_id == owner_id
+            )
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount
 
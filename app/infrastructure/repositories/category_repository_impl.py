@@ -3,13 +3,24 @@ Category Repository Implementation
 ORM-based repository for categories
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, RowMapping
+from sqlalchemy.exc import IntegrityError
+from pymysql.constants.ER import DUP_ENTRY
 from app.domain.models.category import Category
 from app.domain.repositories.category_repository import CategoryRepository
 
 
+def _group_and_type_filter(group_id: Optional[int], type: str, include_default: bool):
+    """WHERE clause shared by the ORM and raw category lookups"""
+    return and_(
+        Category.type == type,
+        (Category.group_id == group_id) | (Category.group_id.is_(None)),
+        (Category.is_default == True) if include_default else True
+    )
+
+
 class CategoryRepositoryImpl(CategoryRepository):
     """SQLAlchemy-based category repository"""
     
@@ -29,16 +40,23 @@ class CategoryRepositoryImpl(CategoryRepository):
         include_default: bool = True
     ) -> list[Category]:
         """Find categories by group and type"""
-        stmt = select(Category).where(
-            and_(
-                Category.type == type,
-                (Category.group_id == group_id) | (Category.group_id.is_(None)),
-                (Category.is_default == True) if include_default else True
-            )
-        )
+        stmt = select(Category).where(_group_and_type_filter(group_id, type, include_default))
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
+    async def list_by_group_and_type_raw(
+        self,
+        group_id: Optional[int],
+        type: str,
+        include_default: bool = True
+    ) -> Sequence[RowMapping]:
+        """Find categories as plain column mappings (no ORM identity map)"""
+        stmt = select(*Category.__table__.columns).where(
+            _group_and_type_filter(group_id, type, include_default)
+        )
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+    
     async def create(self, category: Category) -> Category:
         """Create new category with ORM"""
         self.session.add(category)
@@ -46,6 +64,19 @@ class CategoryRepositoryImpl(CategoryRepository):
         await self.session.refresh(category)
         return category
     
+    async def create_if_absent(self, category: Category) -> Optional[Category]:
+        """Create new category, relying on ux_category_name for duplicate detection"""
+        self.session.add(category)
+        try:
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            if e.orig.args[0] != DUP_ENTRY:
+                raise
+            return None
+        await self.session.refresh(category)
+        return category
+    
     async def update(self, category: Category) -> Category:
         """Update category with ORM"""
         await self.session.merge(category)
@@ -6,7 +6,7 @@ ORM-based repository for group management
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, delete, and_
 from sqlalchemy.orm import selectinload
 from app.domain.models.group import Group, GroupInvite
 from app.domain.models.user import User
@@ -82,32 +82,50 @@ class GroupRepositoryImpl(GroupRepository):
             group_id=group_id,
             code=code,
             created_by=created_by,
-            expires_at=expires_at
+            expires_at=expires_at,
+            created_at=datetime.utcnow()
         )
         self.session.add(invite)
         await self.session.commit()
-        await self.session.refresh(invite)
         return invite
     
-    async def find_invite_by_code(self, code: str) -> Optional[GroupInvite]:
-        """Find invite by code"""
-        stmt = select(GroupInvite).where(GroupInvite.code == code)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def redeem_invite(self, code: str, user_id: int) -> Optional[Group]:
+        """
+        Spend an unexpired invite on adding the user to its group
+        
+        The invite row is locked together with its group, then deleted and
+        the membership written in one transaction, so a code is only used up
+        when the join goes through; a concurrent redemption of the same code
+        waits on the lock and then finds no row. The group is loaded by the
+        same SELECT and returned. Expiry is compared in UTC, the clock
+        expires_at is written with.
+        """
+        live = and_(GroupInvite.code == code, GroupInvite.expires_at > datetime.utcnow())
+        group = (await self.session.execute(
+            select(Group)
+            .join(GroupInvite, GroupInvite.group_id == Group.id)
+            .where(live)
+            .with_for_update()
+        )).scalar_one_or_none()
+        if group is None:
+            return None
+        
+        await self.session.execute(delete(GroupInvite).where(GroupInvite.code == code))
+        await self.session.execute(
+            update(User).where(User.id == user_id).values(group_id=group.id)
+        )
+        await self.session.commit()
+        return group
     
     async def add_user_to_group(self, user_id: int, group_id: int) -> None:
-        """Add user to group"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one()
-        user.group_id = group_id
+        """Add user to group with a single UPDATE"""
+        stmt = update(User).where(User.id == user_id).values(group_id=group_id)
+        await self.session.execute(stmt)
         await self.session.commit()
     
     async def remove_user_from_group(self, user_id: int) -> None:
         """Remove user from group"""
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one()
+        user = await self.session.get_one(User, user_id)
         user.group_id = None
         await self.session.commit()
 
@@ -3,16 +3,53 @@ RecurringRule Repository Implementation
 ORM-based repository for recurring rules
 """
 
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, Select
 from sqlalchemy.orm import selectinload
 from app.domain.models.recurring_rule import RecurringRule
 from app.domain.repositories.recurring_rule_repository import RecurringRuleRepository
 
+# Relationships read by the API serializer; loaded in one batched SELECT each
+_SERIALIZED_RELATIONS = (
+    selectinload(RecurringRule.category),
+    selectinload(RecurringRule.group),
+)
+
+
+def _find_all_stmt(
+    user_id: Optional[int],
+    group_id: Optional[int],
+    is_active: Optional[bool]
+) -> Select:
+    """Build the filtered, eagerly loading rule list query"""
+    stmt = select(RecurringRule)
+    
+    filters = []
+    if user_id is not None:
+        filters.append(RecurringRule.created_by == user_id)
+    if group_id is not None:
+        filters.append(RecurringRule.group_id == group_id)
+    if is_active is not None:
+        filters.append(RecurringRule.is_active == is_active)
+    
+    if filters:
+        stmt = stmt.where(and_(*filters))
+    
+    # Eager loading for performance
+    stmt = stmt.options(*_SERIALIZED_RELATIONS)
+    
+    # Order by active status and creation date
+    return stmt.order_by(
+        RecurringRule.is_active.desc(),
+        RecurringRule.created_at.desc()
+    )
+
 
 class RecurringRuleRepositoryImpl(RecurringRuleRepository):
     """SQLAlchemy-based recurring rule repository"""
+
+    __slots__ = ("session",)
     
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -21,11 +58,7 @@ class RecurringRuleRepositoryImpl(RecurringRuleRepository):
         """Find recurring rule by ID with eager loading"""
         stmt = select(RecurringRule).where(
             RecurringRule.id == rule_id
-        ).options(
-            selectinload(RecurringRule.category),
-            selectinload(RecurringRule.creator),
-            selectinload(RecurringRule.group)
-        )
+        ).options(*_SERIALIZED_RELATIONS)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -36,48 +69,40 @@ class RecurringRuleRepositoryImpl(RecurringRuleRepository):
         is_active: Optional[bool] = None
     ) -> List[RecurringRule]:
         """Find all recurring rules with filters using ORM"""
-        stmt = select(RecurringRule)
-        
-        filters = []
-        if user_id is not None:
-            filters.append(RecurringRule.created_by == user_id)
-        if group_id is not None:
-            filters.append(RecurringRule.group_id == group_id)
-        if is_active is not None:
-            filters.append(RecurringRule.is_active == is_active)
-        
-        if filters:
-            stmt = stmt.where(and_(*filters))
-        
-        # Eager loading for performance
-        stmt = stmt.options(
-            selectinload(RecurringRule.category),
-            selectinload(RecurringRule.creator),
-            selectinload(RecurringRule.group)
-        )
-        
-        # Order by active status and creation date
-        stmt = stmt.order_by(
-            RecurringRule.is_active.desc(),
-            RecurringRule.created_at.desc()
-        )
-        
+        stmt = _find_all_stmt(user_id, group_id, is_active)
         result = await self.session.execute(stmt)
         return result.scalars().all()
     
+    async def stream_all(
+        self,
+        user_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        is_active: Optional[bool] = None
+    ) -> AsyncIterator[RecurringRule]:
+        """Stream recurring rules with filters through a server-side cursor"""
+        stmt = _find_all_stmt(user_id, group_id, is_active).execution_options(yield_per=100)
+        async for rule in await self.session.stream_scalars(stmt):
+            yield rule
+    
     async def create(self, rule: RecurringRule) -> RecurringRule:
         """Create new recurring rule with ORM"""
         self.session.add(rule)
         await self.session.commit()
-        await self.session.refresh(rule)
-        return rule
+        return await self._reload(rule.id)
     
     async def update(self, rule: RecurringRule) -> RecurringRule:
         """Update recurring rule with ORM"""
         await self.session.merge(rule)
         await self.session.commit()
-        await self.session.refresh(rule)
-        return rule
+        return await self._reload(rule.id)
+    
+    async def _reload(self, rule_id: int) -> RecurringRule:
+        """Reload a rule with its serialized relationships after a write"""
+        stmt = select(RecurringRule).where(
+            RecurringRule.id == rule_id
+        ).options(*_SERIALIZED_RELATIONS).execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
     
     async def delete(self, rule_id: int) -> None:
         """Delete recurring rule with ORM"""
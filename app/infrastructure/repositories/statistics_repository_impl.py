@@ -3,21 +3,93 @@ Statistics Repository Implementation
 ORM-based repository for statistics
 """
 
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime, date
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, case, or_
-from sqlalchemy.sql import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, and_, func, case, or_, text, RowMapping, TextClause
 from app.domain.models.transaction import Transaction, TransactionType
 from app.domain.models.category import Category
 from app.domain.repositories.statistics_repository import StatisticsRepository
 
+# Daily trend statements, read as plain mappings (no ORM hydration)
+_DAILY_TREND_GROUP_SQL = text("""
+    SELECT 
+        DATE(date) as date,
+        COALESCE(SUM(CASE WHEN type = 'INCOME' THEN amount ELSE 0 END), 0) as income,
+        COALESCE(SUM(CASE WHEN type = 'EXPENSE' THEN amount ELSE 0 END), 0) as expense
+    FROM transactions 
+    WHERE date >= :start_date
+        AND date <= :end_date
+        AND (group_id = :group_id OR owner_user_id = :user_id)
+    GROUP BY DATE(date)
+    ORDER BY date ASC
+""")
+
+_DAILY_TREND_USER_SQL = text("""
+    SELECT 
+        DATE(date) as date,
+        COALESCE(SUM(CASE WHEN type = 'INCOME' THEN amount ELSE 0 END), 0) as income,
+        COALESCE(SUM(CASE WHEN type = 'EXPENSE' THEN amount ELSE 0 END), 0) as expense
+    FROM transactions 
+    WHERE date >= :start_date
+        AND date <= :end_date
+        AND owner_user_id = :user_id
+    GROUP BY DATE(date)
+    ORDER BY date ASC
+""")
+
+
+def _format_category_stats(category_stats) -> List[dict]:
+    """Format category aggregate rows with their share of the total"""
+    total_amount = sum(stat.total_amount or 0 for stat in category_stats)
+    
+    formatted_stats = []
+    for stat in category_stats:
+        amount = stat.total_amount or 0
+        formatted_stats.append({
+            'category_id': stat.category_id,
+            'category_name': stat.category_name,
+            'total_amount': int(amount),
+            'transaction_count': stat.transaction_count,
+            'percentage': float(amount * 100 / total_amount) if total_amount > 0 else 0.0,
+            'color': stat.color
+        })
+    
+    return formatted_stats
+
 
 class StatisticsRepositoryImpl(StatisticsRepository):
     """SQLAlchemy-based statistics repository"""
+
+    __slots__ = ("session", "session_factory")
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    ):
         self.session = session
+        self.session_factory = session_factory
+    
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[AsyncSession]:
+        """
+        Session for read-only queries
+        
+        With a session factory each read gets its own short-lived session
+        (and pooled connection), so reads can be awaited concurrently.
+        """
+        if self.session_factory is None:
+            yield self.session
+        else:
+            async with self.session_factory() as session:
+                yield session
+    
+    async def _fetch_raw(self, stmt: TextClause, params: dict) -> Sequence[RowMapping]:
+        """Run a read-only textual query, returning plain row mappings"""
+        async with self._reader() as session:
+            return (await session.execute(stmt, params)).mappings().all()
     
     async def get_category_statistics(
         self,
@@ -46,46 +118,80 @@ class StatisticsRepositoryImpl(StatisticsRepository):
         else:
             filters.append(Transaction.owner_user_id == user_id)
         
-        # Group by category with aggregate functions
+        # Group by category with aggregate functions; category details come
+        # from the join instead of a second lookup
+        total = func.sum(Transaction.amount).label('total_amount')
         stmt = select(
             Transaction.category_id,
-            func.sum(Transaction.amount).label('total_amount'),
+            Category.name.label('category_name'),
+            Category.color,
+            total,
             func.count(Transaction.id).label('transaction_count')
+        ).join(
+            Category, Category.id == Transaction.category_id
         ).where(
-            and_(*filters),
-            Transaction.category_id.isnot(None)
-        ).group_by(Transaction.category_id)
+            and_(*filters)
+        ).group_by(
+            Transaction.category_id, Category.name, Category.color
+        ).order_by(total.desc())
         
-        result = await self.session.execute(stmt)
-        category_stats = result.all()
+        async with self._reader() as session:
+            category_stats = (await session.execute(stmt)).all()
+        
+        return _format_category_stats(category_stats)
+    
+    async def get_category_statistics_both(
+        self,
+        user_id: int,
+        group_id: Optional[int],
+        start_date: date,
+        end_date: date
+    ) -> dict:
+        """Get income and expense category statistics from one GROUP BY category, type"""
+        filters = [
+            Transaction.date >= start_date,
+            Transaction.date <= end_date,
+            Transaction.type.in_((TransactionType.INCOME, TransactionType.EXPENSE))
+        ]
         
-        # Get category details
-        category_ids = [stat.category_id for stat in category_stats if stat.category_id]
-        if not category_ids:
-            return []
+        # Group filter: include transactions from group or owned by user
+        if group_id:
+            filters.append(
+                or_(
+                    Transaction.group_id == group_id,
+                    Transaction.owner_user_id == user_id
+                )
+            )
+        else:
+            filters.append(Transaction.owner_user_id == user_id)
         
-        categories_stmt = select(Category).where(Category.id.in_(category_ids))
-        categories_result = await self.session.execute(categories_stmt)
-        categories = {cat.id: cat for cat in categories_result.scalars().all()}
+        total = func.sum(Transaction.amount).label('total_amount')
+        stmt = select(
+            Transaction.type,
+            Transaction.category_id,
+            Category.name.label('category_name'),
+            Category.color,
+            total,
+            func.count(Transaction.id).label('transaction_count')
+        ).join(
+            Category, Category.id == Transaction.category_id
+        ).where(
+            and_(*filters)
+        ).group_by(
+            Transaction.category_id, Transaction.type, Category.name, Category.color
+        ).order_by(total.desc())
         
-        # Format response
-        formatted_stats = []
-        total_amount = sum(stat.total_amount or 0 for stat in category_stats)
+        async with self._reader() as session:
+            category_stats = (await session.execute(stmt)).all()
         
-        for stat in category_stats:
-            category = categories.get(stat.category_id)
-            if category:
-                amount = stat.total_amount or 0
-                formatted_stats.append({
-                    'category_id': stat.category_id,
-                    'category_name': category.name,
-                    'total_amount': int(amount),
-                    'transaction_count': stat.transaction_count,
-                    'percentage': (amount / total_amount * 100) if total_amount > 0 else 0,
-                    'color': category.color
-                })
+        # Partition by type; each partition keeps the amount ordering
+        income = [stat for stat in category_stats if stat.type == TransactionType.INCOME]
+        expense = [stat for stat in category_stats if stat.type == TransactionType.EXPENSE]
         
-        return formatted_stats
+        return {
+            'INCOME': _format_category_stats(income),
+            'EXPENSE': _format_category_stats(expense)
+        }
     
     async def get_summary_statistics(
         self,
@@ -112,22 +218,23 @@ class StatisticsRepositoryImpl(StatisticsRepository):
         else:
             base_filters.append(Transaction.owner_user_id == user_id)
         
-        # Get transaction count
-        count_stmt = select(func.count(Transaction.id)).where(and_(*base_filters))
-        count_result = await self.session.execute(count_stmt)
-        transaction_count = count_result.scalar_one() or 0
-        
-        # Get income sum
-        income_filters = base_filters + [Transaction.type == TransactionType.INCOME]
-        income_stmt = select(func.sum(Transaction.amount)).where(and_(*income_filters))
-        income_result = await self.session.execute(income_stmt)
-        total_income = int(income_result.scalar_one() or 0)
-        
-        # Get expense sum
-        expense_filters = base_filters + [Transaction.type == TransactionType.EXPENSE]
-        expense_stmt = select(func.sum(Transaction.amount)).where(and_(*expense_filters))
-        expense_result = await self.session.execute(expense_stmt)
-        total_expense = int(expense_result.scalar_one() or 0)
+        async with self._reader() as session:
+            # Get transaction count
+            count_stmt = select(func.count(Transaction.id)).where(and_(*base_filters))
+            count_result = await session.execute(count_stmt)
+            transaction_count = count_result.scalar_one() or 0
+            
+            # Get income sum
+            income_filters = base_filters + [Transaction.type == TransactionType.INCOME]
+            income_stmt = select(func.sum(Transaction.amount)).where(and_(*income_filters))
+            income_result = await session.execute(income_stmt)
+            total_income = int(income_result.scalar_one() or 0)
+            
+            # Get expense sum
+            expense_filters = base_filters + [Transaction.type == TransactionType.EXPENSE]
+            expense_stmt = select(func.sum(Transaction.amount)).where(and_(*expense_filters))
+            expense_result = await session.execute(expense_stmt)
+            total_expense = int(expense_result.scalar_one() or 0)
         
         return {
             'total_income': total_income,
@@ -143,53 +250,67 @@ class StatisticsRepositoryImpl(StatisticsRepository):
         start_date: date,
         end_date: date
     ) -> List[dict]:
-        """Get daily trend data using raw SQL for better performance"""
-        # Raw SQL for daily aggregation - build query conditionally for security
+        """Get daily trend data with a textual aggregate query"""
+        # Raw SQL for daily aggregation - pick the statement conditionally for security
         if group_id:
-            sql = text("""
-                SELECT 
-                    DATE(date) as date,
-                    COALESCE(SUM(CASE WHEN type = 'INCOME' THEN amount ELSE 0 END), 0) as income,
-                    COALESCE(SUM(CASE WHEN type = 'EXPENSE' THEN amount ELSE 0 END), 0) as expense
-                FROM transactions 
-                WHERE date >= :start_date
-                    AND date <= :end_date
-                    AND (group_id = :group_id OR owner_user_id = :user_id)
-                GROUP BY DATE(date)
-                ORDER BY date ASC
-            """).bindparams(
-                start_date=start_date,
-                end_date=end_date,
-                group_id=group_id,
-                user_id=user_id
-            )
+            sql = _DAILY_TREND_GROUP_SQL
+            params = {"start_date": start_date, "end_date": end_date, "group_id": group_id, "user_id": user_id}
         else:
-            sql = text("""
-                SELECT 
-                    DATE(date) as date,
-                    COALESCE(SUM(CASE WHEN type = 'INCOME' THEN amount ELSE 0 END), 0) as income,
-                    COALESCE(SUM(CASE WHEN type = 'EXPENSE' THEN amount ELSE 0 END), 0) as expense
-                FROM transactions 
-                WHERE date >= :start_date
-                    AND date <= :end_date
-                    AND owner_user_id = :user_id
-                GROUP BY DATE(date)
-                ORDER BY date ASC
-            """).bindparams(
-                start_date=start_date,
-                end_date=end_date,
-                user_id=user_id
+            sql = _DAILY_TREND_USER_SQL
+            params = {"start_date": start_date, "end_date": end_date, "user_id": user_id}
+        
+        rows = await self._fetch_raw(sql, params)
+        
+        return [
+            {
+                'date': str(row['date']),
+                'income': int(row['income'] or 0),
+                'expense': int(row['expense'] or 0),
+                'net_amount': int((row['income'] or 0) - (row['expense'] or 0))
+            }
+            for row in rows
+        ]
+    
+    async def get_daily_summary(
+        self,
+        user_id: int,
+        group_id: Optional[int],
+        start_date: date,
+        end_date: date
+    ) -> List[dict]:
+        """Get per-day income, expense and transaction count in one aggregation"""
+        filters = [
+            Transaction.date >= start_date,
+            Transaction.date <= end_date
+        ]
+        
+        # Group filter: include transactions from group or owned by user
+        if group_id:
+            filters.append(
+                or_(
+                    Transaction.group_id == group_id,
+                    Transaction.owner_user_id == user_id
+                )
             )
+        else:
+            filters.append(Transaction.owner_user_id == user_id)
         
-        result = await self.session.execute(sql)
-        rows = result.all()
+        stmt = select(
+            Transaction.date,
+            func.sum(case((Transaction.type == TransactionType.INCOME, Transaction.amount), else_=0)).label('income'),
+            func.sum(case((Transaction.type == TransactionType.EXPENSE, Transaction.amount), else_=0)).label('expense'),
+            func.count(Transaction.id).label('transaction_count')
+        ).where(and_(*filters)).group_by(Transaction.date).order_by(Transaction.date)
+        
+        async with self._reader() as session:
+            rows = (await session.execute(stmt)).all()
         
         return [
             {
                 'date': str(row.date),
                 'income': int(row.income or 0),
                 'expense': int(row.expense or 0),
-                'net_amount': int((row.income or 0) - (row.expense or 0))
+                'transaction_count': row.transaction_count
             }
             for row in rows
         ]
@@ -207,59 +328,60 @@ class StatisticsRepositoryImpl(StatisticsRepository):
         monthly_data = []
         today = datetime.now().date()
         
-        for i in range(months - 1, -1, -1):  # Last 6 months, oldest first
-            # Calculate month range
-            month_date = today.replace(day=1)
-            for _ in range(i):
-                # Go back i months
-                if month_date.month == 1:
-                    month_date = month_date.replace(year=month_date.year - 1, month=12)
+        async with self._reader() as session:
+            for i in range(months - 1, -1, -1):  # Last 6 months, oldest first
+                # Calculate month range
+                month_date = today.replace(day=1)
+                for _ in range(i):
+                    # Go back i months
+                    if month_date.month == 1:
+                        month_date = month_date.replace(year=month_date.year - 1, month=12)
+                    else:
+                        month_date = month_date.replace(month=month_date.month - 1)
+                
+                start_of_month = month_date
+                if month_date.month == 12:
+                    end_of_month = month_date.replace(year=month_date.year + 1, month=1) - timedelta(days=1)
                 else:
-                    month_date = month_date.replace(month=month_date.month - 1)
-            
-            start_of_month = month_date
-            if month_date.month == 12:
-                end_of_month = month_date.replace(year=month_date.year + 1, month=1) - timedelta(days=1)
-            else:
-                end_of_month = month_date.replace(month=month_date.month + 1) - timedelta(days=1)
-            
-            # Build filters
-            filters = [
-                Transaction.date >= start_of_month,
-                Transaction.date <= end_of_month
-            ]
-            
-            if group_id:
-                filters.append(
-                    or_(
-                        Transaction.group_id == group_id,
-                        Transaction.owner_user_id == user_id
+                    end_of_month = month_date.replace(month=month_date.month + 1) - timedelta(days=1)
+                
+                # Build filters
+                filters = [
+                    Transaction.date >= start_of_month,
+                    Transaction.date <= end_of_month
+                ]
+                
+                if group_id:
+                    filters.append(
+                        or_(
+                            Transaction.group_id == group_id,
+                            Transaction.owner_user_id == user_id
+                        )
                     )
-                )
-            else:
-                filters.append(Transaction.owner_user_id == user_id)
-            
-            # Get income
-            income_filters = filters + [Transaction.type == TransactionType.INCOME]
-            income_stmt = select(func.sum(Transaction.amount)).where(and_(*income_filters))
-            income_result = await self.session.execute(income_stmt)
-            total_income = int(income_result.scalar_one() or 0)
-            
-            # Get expense
-            expense_filters = filters + [Transaction.type == TransactionType.EXPENSE]
-            expense_stmt = select(func.sum(Transaction.amount)).where(and_(*expense_filters))
-            expense_result = await self.session.execute(expense_stmt)
-            total_expense = int(expense_result.scalar_one() or 0)
-            
-            # Format period string (e.g., "2025년 1월")
-            period = f"{start_of_month.year}년 {start_of_month.month}월"
-            
-            monthly_data.append({
-                'period': period,
-                'total_income': total_income,
-                'total_expense': total_expense,
-                'net_amount': total_income - total_expense
-            })
+                else:
+                    filters.append(Transaction.owner_user_id == user_id)
+                
+                # Get income
+                income_filters = filters + [Transaction.type == TransactionType.INCOME]
+                income_stmt = select(func.sum(Transaction.amount)).where(and_(*income_filters))
+                income_result = await session.execute(income_stmt)
+                total_income = int(income_result.scalar_one() or 0)
+                
+                # Get expense
+                expense_filters = filters + [Transaction.type == TransactionType.EXPENSE]
+                expense_stmt = select(func.sum(Transaction.amount)).where(and_(*expense_filters))
+                expense_result = await session.execute(expense_stmt)
+                total_expense = int(expense_result.scalar_one() or 0)
+                
+                # Format period string (e.g., "2025년 1월")
+                period = f"{start_of_month.year}년 {start_of_month.month}월"
+                
+                monthly_data.append({
+                    'period': period,
+                    'total_income': total_income,
+                    'total_expense': total_expense,
+                    'net_amount': total_income - total_expense
+                })
         
         return monthly_data
 
@@ -3,7 +3,7 @@ Transaction Repository Implementation
 ORM-based repository for transactions
 """
 
-from typing import Optional
+from typing import Optional, AsyncIterator
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
@@ -12,6 +12,36 @@ from app.domain.models.transaction import Transaction
 from app.domain.repositories.transaction_repository import TransactionRepository
 
 
+def _build_filters(
+    group_id: Optional[int],
+    user_id: Optional[int],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    category_id: Optional[int],
+    search: Optional[str]
+) -> list:
+    """Build the WHERE clauses shared by list, count and stream queries"""
+    filters = []
+    if group_id is not None:
+        filters.append(Transaction.group_id == group_id)
+    if user_id is not None:
+        filters.append(Transaction.owner_user_id == user_id)
+    if start_date is not None:
+        filters.append(Transaction.date >= start_date)
+    if end_date is not None:
+        filters.append(Transaction.date <= end_date)
+    if category_id is not None:
+        filters.append(Transaction.category_id == category_id)
+    
+    # Search filter (memo or merchant)
+    if search:
+        filters.append(or_(
+            Transaction.memo.like(f"%{search}%"),
+            Transaction.merchant.like(f"%{search}%")
+        ))
+    return filters
+
+
 class TransactionRepositoryImpl(TransactionRepository):
     """SQLAlchemy-based transaction repository"""
     
@@ -44,35 +74,16 @@ class TransactionRepositoryImpl(TransactionRepository):
         """Find transactions with filters and pagination using ORM"""
         stmt = select(Transaction)
         
-        # Build dynamic filters
-        filters = []
-        if group_id is not None:
-            filters.append(Transaction.group_id == group_id)
-        if user_id is not None:
-            filters.append(Transaction.owner_user_id == user_id)
-        if start_date is not None:
-            filters.append(Transaction.date >= start_date)
-        if end_date is not None:
-            filters.append(Transaction.date <= end_date)
-        if category_id is not None:
-            filters.append(Transaction.category_id == category_id)
-        
-        # Search filter (memo or merchant)
-        if search:
-            search_filter = or_(
-                Transaction.memo.like(f"%{search}%"),
-                Transaction.merchant.like(f"%{search}%")
-            )
-            filters.append(search_filter)
+        filters = _build_filters(group_id, user_id, start_date, end_date, category_id, search)
         
         if filters:
             stmt = stmt.where(and_(*filters))
         
-        # Eager loading for performance
+        # Batch-load the per-row relations; owner is always the requesting
+        # user, so it is not preloaded
         stmt = stmt.options(
             selectinload(Transaction.category),
-            selectinload(Transaction.tag),
-            selectinload(Transaction.owner)
+            selectinload(Transaction.tag)
         )
         
         # Order and paginate
@@ -93,25 +104,7 @@ class TransactionRepositoryImpl(TransactionRepository):
         """Count total transactions with filters"""
         stmt = select(func.count(Transaction.id))
         
-        filters = []
-        if group_id is not None:
-            filters.append(Transaction.group_id == group_id)
-        if user_id is not None:
-            filters.append(Transaction.owner_user_id == user_id)
-        if start_date is not None:
-            filters.append(Transaction.date >= start_date)
-        if end_date is not None:
-            filters.append(Transaction.date <= end_date)
-        if category_id is not None:
-            filters.append(Transaction.category_id == category_id)
-        
-        # Search filter (memo or merchant)
-        if search:
-            search_filter = or_(
-                Transaction.memo.like(f"%{search}%"),
-                Transaction.merchant.like(f"%{search}%")
-            )
-            filters.append(search_filter)
+        filters = _build_filters(group_id, user_id, start_date, end_date, category_id, search)
         
         if filters:
             stmt = stmt.where(and_(*filters))
@@ -119,6 +112,58 @@ class TransactionRepositoryImpl(TransactionRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one()
     
+    async def find_all_with_count(
+        self,
+        group_id: Optional[int],
+        user_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category_id: Optional[int],
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> tuple[list[Transaction], int]:
+        """Find a page of transactions and the filtered total with COUNT(*) OVER ()"""
+        stmt = select(Transaction, func.count().over().label('total_count'))
+        
+        filters = _build_filters(group_id, user_id, start_date, end_date, category_id, search)
+        
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        
+        stmt = stmt.options(
+            selectinload(Transaction.category),
+            selectinload(Transaction.tag)
+        ).order_by(Transaction.date.desc()).limit(limit).offset(offset)
+        
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+        
+        # A page past the end has no row to carry the total
+        if offset:
+            total = await self.count_total(group_id, user_id, start_date, end_date, category_id, search)
+            return [], total
+        return [], 0
+    
+    async def stream_all(
+        self,
+        group_id: Optional[int],
+        user_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category_id: Optional[int],
+        search: Optional[str] = None
+    ) -> AsyncIterator[Transaction]:
+        """Stream all matching transactions through a server-side cursor"""
+        stmt = select(Transaction)
+        filters = _build_filters(group_id, user_id, start_date, end_date, category_id, search)
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        stmt = stmt.order_by(Transaction.date.desc()).execution_options(yield_per=100)
+        async for transaction in await self.session.stream_scalars(stmt):
+            yield transaction
+    
     async def create(self, transaction: Transaction) -> Transaction:
         """Create new transaction with ORM"""
         self.session.add(transaction)
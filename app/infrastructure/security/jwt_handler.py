@@ -64,6 +64,12 @@ def verify_and_decode_token(token: str, token_type: str = "access") -> dict:
         elif token_type != "reset" and payload.get("type") != token_type:
             raise JWTError("Invalid token type")
         
+        # "sub" must be a string on the wire; convert once here so callers
+        # (and the decoded-token cache) get the user id as an int
+        sub = payload.get("sub")
+        if isinstance(sub, str) and sub.isdigit():
+            payload["sub"] = int(sub)
+        
         return payload
     except JWTError:
         raise JWTError("Invalid token")
@@ -2,10 +2,21 @@
 Password Hashing with BCrypt
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a CPU-sized thread pool keeps hashing parallel
+# without blocking the event loop
+_hasher_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hasher")
+
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """Hash password using BCrypt"""
@@ -16,3 +27,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+
+async def run_hasher(func: Callable[..., T], *args) -> T:
+    """Run a blocking hash/verify call off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_hasher_executor, func, *args)
@@ -2,12 +2,30 @@
 FastAPI Application Entry Point
 """
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.database import engine, warm_up_pool
+from app.utils.clock import start_clock
 from app.api.v1 import auth, groups, categories, statistics, dashboard, recurring_rules, budgets, balance
 from app.api.v1 import settings as settings_api
 from app.api.v1.transactions import router as transactions_router
+from app.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background tasks (pool warm-up, clock) and release resources on shutdown"""
+    warm_up = asyncio.create_task(warm_up_pool())
+    clock = start_clock()
+    yield
+    clock.cancel()
+    warm_up.cancel()
+    await engine.dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -16,6 +34,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -27,6 +47,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Exception handlers: services raise domain errors, routers stay free of try/except.
+# Other exceptions (a stray ValueError included) are server errors, not 400s
+@app.exception_handler(NotFoundError)
+async def not_found_handler(request: Request, exc: NotFoundError):
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_404_NOT_FOUND)
+
+
+@app.exception_handler(ForbiddenError)
+async def forbidden_handler(request: Request, exc: ForbiddenError):
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_403_FORBIDDEN)
+
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError):
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_400_BAD_REQUEST)
+
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    return ORJSONResponse(
+        {"detail": "서버 오류가 발생했습니다"},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(groups.router, prefix="/api/v1/groups", tags=["Groups"])
@@ -61,5 +106,5 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
 
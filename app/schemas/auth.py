@@ -5,6 +5,7 @@ Pydantic models for authentication API
 
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
+from datetime import datetime
 
 
 class SignupRequest(BaseModel):
@@ -45,6 +46,17 @@ class UserProfileResponse(BaseModel):
         from_attributes = True
 
 
+class UserProfileOut(BaseModel):
+    """Profile payload for /profile endpoints"""
+    id: int
+    name: str = Field(validation_alias="nickname")
+    email: str
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
 class ChangePasswordRequest(BaseModel):
     """Change password request"""
     old_password: str
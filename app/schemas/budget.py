@@ -5,6 +5,7 @@ Pydantic models for budget API
 
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from datetime import datetime
 from app.domain.models.budget import OwnerType, BudgetStatus
 
 
@@ -44,13 +45,13 @@ class BudgetStatusResponse(BaseModel):
 class BudgetResponse(BaseModel):
     """Budget response"""
     id: int
-    owner_type: str
+    owner_type: OwnerType
     owner_id: int
     period: str
     total_amount: int
-    status: str
-    created_at: str
-    updated_at: str
+    status: BudgetStatus
+    created_at: datetime
+    updated_at: datetime
     
     class Config:
         from_attributes = True
@@ -4,6 +4,7 @@ Pydantic models for settings API
 """
 
 from pydantic import BaseModel, Field
+from types import MappingProxyType
 from typing import Optional, Literal
 
 
@@ -63,6 +64,10 @@ class UpdateSettingsRequest(BaseModel):
     split_default: Optional[int] = Field(None, ge=0, le=100)
 
 
-# Default settings
-DEFAULT_SETTINGS = AppSettings().model_dump()
+# Default settings, read-only so merges and responses cannot alter them
+_defaults = AppSettings().model_dump()
+DEFAULT_SETTINGS = MappingProxyType({
+    **_defaults,
+    'category_display': MappingProxyType(_defaults['category_display'])
+})
 
@@ -0,0 +1,77 @@
+"""
+Response Cache
+Short-TTL in-process cache with ETag support for heavy read endpoints
+"""
+
+import hashlib
+from datetime import date
+from typing import Any, Hashable, Optional, Tuple
+
+import orjson
+from cachetools import TLRUCache, TTLCache
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+RESPONSE_CACHE_TTL = 30  # seconds
+CACHE_CONTROL = f"private, max-age={RESPONSE_CACHE_TTL}"
+
+CURRENT_MONTH_TTL = 60  # seconds
+CLOSED_MONTH_TTL = 24 * 60 * 60  # seconds
+
+# Keys are (namespace, user_id, group_id, *params) so writes can invalidate by owner
+response_cache: TTLCache = TTLCache(maxsize=10_000, ttl=RESPONSE_CACHE_TTL)
+
+
+TRANSACTION_CACHE_TTL = 300  # seconds
+
+# Serialized single transactions keyed by (user_id, transaction_id); only the
+# owner can read, update or delete them, so writes evict the one key
+transaction_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TRANSACTION_CACHE_TTL)
+
+
+PROCESS_JOB_TTL = 60 * 60  # seconds
+
+# Background recurring-rule process jobs: job_id -> {user_id, status, result}
+process_jobs: TTLCache = TTLCache(maxsize=10_000, ttl=PROCESS_JOB_TTL)
+
+
+def _monthly_ttu(key: Tuple[Hashable, ...], value: Any, now: float) -> float:
+    """Closed months rarely change; the current month expires quickly"""
+    year, month = key[3], key[4]
+    today = date.today()
+    ttl = CURRENT_MONTH_TTL if (year, month) == (today.year, today.month) else CLOSED_MONTH_TTL
+    return now + ttl
+
+
+# Keys are (namespace, user_id, group_id, year, month)
+monthly_stats_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_monthly_ttu)
+
+
+def get_cached(key: Tuple[Hashable, ...]) -> Optional[Tuple[str, Any]]:
+    """Get cached (etag, payload) for key"""
+    return response_cache.get(key)
+
+
+def set_cached(key: Tuple[Hashable, ...], payload: Any) -> Tuple[str, Any]:
+    """Encode payload, compute its ETag and cache both"""
+    payload = jsonable_encoder(payload)
+    etag = f'"{hashlib.md5(orjson.dumps(payload)).hexdigest()}"'
+    response_cache[key] = (etag, payload)
+    return etag, payload
+
+
+def conditional_response(request: Request, response: Response, etag: str, payload: Any) -> Any:
+    """Return 304 when the client already has this ETag, otherwise the payload"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+def invalidate_owner(user_id: Optional[int], group_id: Optional[int] = None) -> None:
+    """Drop cached responses belonging to a user or group"""
+    for cache in (response_cache, monthly_stats_cache):
+        for key in list(cache.keys()):
+            if (user_id is not None and key[1] == user_id) or (group_id is not None and key[2] == group_id):
+                cache.pop(key, None)
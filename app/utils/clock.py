@@ -0,0 +1,31 @@
+"""
+Clock
+Current date refreshed once a second for hot request paths
+"""
+
+import asyncio
+from datetime import date
+
+CLOCK_TICK = 1  # seconds
+
+_today: date = date.today()
+
+
+def today() -> date:
+    """Current date as of the last tick"""
+    return _today
+
+
+async def _tick() -> None:
+    """Refresh the cached date every tick"""
+    global _today
+    while True:
+        await asyncio.sleep(CLOCK_TICK)
+        _today = date.today()
+
+
+def start_clock() -> asyncio.Task:
+    """Start refreshing the cached date on the running loop"""
+    global _today
+    _today = date.today()
+    return asyncio.create_task(_tick())
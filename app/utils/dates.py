@@ -0,0 +1,43 @@
+"""
+Date Helpers
+Month and YYYY-MM period bounds shared by services and routers
+"""
+
+import re
+from calendar import monthrange
+from datetime import date
+from functools import lru_cache
+
+# YYYY-MM period format
+_PERIOD_RE = re.compile(r'^(\d{4})-(\d{2})$')
+
+
+def _compute_month_bounds(year: int, month: int) -> tuple[date, date]:
+    """First and last day of the month, computed with monthrange"""
+    return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+
+
+# Bounds for the active window (previous, current and next year), built at import
+_THIS_YEAR = date.today().year
+_MONTH_BOUNDS: dict[tuple[int, int], tuple[date, date]] = {
+    (year, month): _compute_month_bounds(year, month)
+    for year in range(_THIS_YEAR - 1, _THIS_YEAR + 2)
+    for month in range(1, 13)
+}
+
+
+def month_bounds(year: int, month: int) -> tuple[date, date]:
+    """First and last day of the month"""
+    bounds = _MONTH_BOUNDS.get((year, month))
+    if bounds is None:
+        bounds = _compute_month_bounds(year, month)
+    return bounds
+
+
+@lru_cache(maxsize=512)
+def period_bounds(period: str) -> tuple[date, date]:
+    """Parse YYYY-MM period into (first day, last day) of the month"""
+    match = _PERIOD_RE.match(period)
+    if match is None:
+        raise ValueError(f"Expected YYYY-MM, got {period!r}")
+    return month_bounds(int(match.group(1)), int(match.group(2)))
@@ -18,12 +18,17 @@ class AuthorizationError(ApplicationError):
     pass
 
 
-class NotFoundError(ApplicationError):
+class ForbiddenError(AuthorizationError, ValueError):
+    """Resource owned by another user"""
+    pass
+
+
+class NotFoundError(ApplicationError, ValueError):
     """Resource not found"""
     pass
 
 
-class ValidationError(ApplicationError):
+class ValidationError(ApplicationError, ValueError):
     """Invalid data"""
     pass
 
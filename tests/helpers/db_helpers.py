@@ -0,0 +1,30 @@
+"""
+Database Helpers
+In-memory SQLite sessions for repository-level tests
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.database import Base
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@asynccontextmanager
+async def sqlite_session(**functions: Callable) -> AsyncIterator[AsyncSession]:
+    """
+    In-memory SQLite session with all tables created
+
+    Keyword arguments register one-argument SQL functions, for MySQL
+    functions (YEAR, MONTH, ...) that SQLite lacks.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        raw = (await (await session.connection()).get_raw_connection()).driver_connection
+        for name, function in functions.items():
+            await raw.create_function(name, 1, function)
+        yield session
+    await engine.dispose()
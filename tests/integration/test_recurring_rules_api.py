@@ -50,8 +50,12 @@ async def test_process_recurring_rules(client: AsyncClient, test_user):
         json={"target_date": str(date.today())}
     )
     
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
     assert data["success"] is True
-    assert "created" in data
+    assert data["status"] == "queued"
+    
+    job_response = await client.get(f"/api/v1/recurring-rules/process/{data['job_id']}")
+    assert job_response.status_code == 200
+    assert job_response.json()["status"] in ("queued", "running", "completed", "failed")
 
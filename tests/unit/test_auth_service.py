@@ -115,9 +115,8 @@ async def test_refresh_token_success(auth_service, mock_auth_repo):
     mock_auth_repo.find_user_by_id.return_value = user
     
     # Create a real refresh token for testing
-    from app.application.factories.token_factory import TokenFactory
-    token_factory = TokenFactory()
-    real_token = token_factory.create_tokens(1, "test@example.com").refresh_token
+    from app.application.factories.token_factory import create_tokens
+    real_token = create_tokens(1, "test@example.com").refresh_token
     
     # Act
     result = await auth_service.refresh_token(real_token)
@@ -173,3 +172,17 @@ async def test_change_password_invalid_old_password(mock_verify, auth_service, m
     with pytest.raises(ValueError, match="Invalid password"):
         await auth_service.change_password(1, "wrong_password", "new_password123")
 
+
+
+@pytest.mark.asyncio
+async def test_forgot_password_unknown_email(auth_service, mock_auth_repo):
+    """Test forgot password for an unknown email returns no token"""
+    # Arrange
+    mock_auth_repo.find_user_by_email.return_value = None
+    
+    # Act
+    result = await auth_service.forgot_password("unknown@example.com")
+    
+    # Assert
+    assert result == ""
+    mock_auth_repo.find_user_by_email.assert_called_once_with("unknown@example.com")
@@ -0,0 +1,59 @@
+"""
+Unit Tests for BalanceRepositoryImpl
+"""
+
+import pytest
+from datetime import date
+from app.domain.models.transaction import TransactionType
+from app.infrastructure.repositories import balance_repository_impl
+from app.infrastructure.repositories.balance_repository_impl import BalanceRepositoryImpl
+from tests.helpers.test_data_factory import create_test_transaction
+from tests.helpers.db_helpers import sqlite_session
+
+
+class _FixedDate(date):
+    """date with a pinned today() so the trend window is deterministic"""
+
+    @classmethod
+    def today(cls):
+        return cls(2024, 8, 30)
+
+
+@pytest.mark.asyncio
+async def test_compute_balance_bundle_trend_window(monkeypatch):
+    """Test the trend only counts rows in the window while the balance counts all"""
+    monkeypatch.setattr(balance_repository_impl, "date", _FixedDate)
+
+    # SQLite has no YEAR()/MONTH(); dates are stored as YYYY-MM-DD text
+    async with sqlite_session(
+        year=lambda value: int(value[:4]),
+        month=lambda value: int(value[5:7])
+    ) as session:
+        # Arrange: the window is 2024-03-03 .. 2024-08-30
+        rows = [
+            (date(2024, 3, 1), TransactionType.EXPENSE, 1000),    # first month, before start
+            (date(2024, 3, 10), TransactionType.EXPENSE, 300),
+            (date(2024, 8, 10), TransactionType.INCOME, 5000),
+            (date(2024, 8, 31), TransactionType.INCOME, 700),     # after today
+        ]
+        for transaction_id, (day, transaction_type, amount) in enumerate(rows, start=1):
+            session.add(create_test_transaction(
+                transaction_id=transaction_id,
+                transaction_type=transaction_type,
+                amount=amount,
+                category_id=None,
+                transaction_date=day
+            ))
+        await session.commit()
+        repository = BalanceRepositoryImpl(session)
+
+        # Act
+        current_balance, trend = await repository.compute_balance_bundle(user_id=1, months=6)
+
+        # Assert
+        assert current_balance == -1000 - 300 + 5000 + 700
+        assert [row['month'] for row in trend] == [
+            '2024-03', '2024-04', '2024-05', '2024-06', '2024-07', '2024-08'
+        ]
+        assert trend[0] == {'month': '2024-03', 'balance': -300, 'income': 0, 'expense': 300}
+        assert trend[-1] == {'month': '2024-08', 'balance': 5000, 'income': 5000, 'expense': 0}
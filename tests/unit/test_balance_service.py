@@ -107,25 +107,14 @@ async def test_get_monthly_trend_success(balance_service, mock_balance_repo):
 @pytest.mark.asyncio
 async def test_calculate_projected_balance_success(balance_service, mock_balance_repo, mock_session):
     """Test successful projected balance calculation"""
-    from app.domain.models.recurring_rule import RecurringRule, RecurringFrequency
-    from sqlalchemy import select
-    from sqlalchemy.orm import AsyncResult
+    from unittest.mock import MagicMock
     
     # Arrange
     mock_balance_repo.calculate_balance.return_value = 500000
     
-    # Mock recurring rules
-    mock_rule = RecurringRule(
-        id=1,
-        created_by=1,
-        amount=100000,
-        frequency=RecurringFrequency.MONTHLY,
-        is_active=True
-    )
-    
-    # Mock session execute
-    mock_result = AsyncMock()
-    mock_result.scalars.return_value.all.return_value = [mock_rule]
+    # Mock the aggregated recurring projection (one INCOME rule of 100000/month)
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = 100000 * 3
     mock_session.execute.return_value = mock_result
     
     # Act
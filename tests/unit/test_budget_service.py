@@ -79,7 +79,7 @@ async def test_get_budget_success(budget_service, mock_budget_repo):
         status=BudgetStatus.ACTIVE
     )
     
-    mock_budget_repo.find_by_id.return_value = budget
+    mock_budget_repo.find_owned.return_value = budget
     
     # Act
     result = await budget_service.get_budget(1, OwnerType.USER, 1)
@@ -87,20 +87,32 @@ async def test_get_budget_success(budget_service, mock_budget_repo):
     # Assert
     assert result.id == 1
     assert result.period == "2025-01"
-    mock_budget_repo.find_by_id.assert_called_once_with(1)
+    mock_budget_repo.find_owned.assert_called_once_with(1, OwnerType.USER, 1)
 
 
 @pytest.mark.asyncio
 async def test_get_budget_not_found(budget_service, mock_budget_repo):
     """Test budget retrieval when not found"""
     # Arrange
-    mock_budget_repo.find_by_id.return_value = None
+    mock_budget_repo.find_owned.return_value = None
     
     # Act & Assert
     with pytest.raises(ValueError, match="Budget not found"):
         await budget_service.get_budget(999, OwnerType.USER, 1)
 
 
+@pytest.mark.asyncio
+async def test_delete_budget_not_owned(budget_service, mock_budget_repo):
+    """Test deleting a budget of another owner deletes nothing"""
+    # Arrange
+    mock_budget_repo.delete_if_owned.return_value = 0
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="Budget not found"):
+        await budget_service.delete_budget(1, OwnerType.USER, 2)
+    mock_budget_repo.delete_if_owned.assert_called_once_with(1, OwnerType.USER, 2)
+
+
 @pytest.mark.asyncio
 async def test_create_or_update_budget_new(budget_service, mock_budget_repo):
     """Test successful budget creation"""
@@ -114,8 +126,7 @@ async def test_create_or_update_budget_new(budget_service, mock_budget_repo):
         status=BudgetStatus.ACTIVE
     )
     
-    mock_budget_repo.find_by_period.return_value = None
-    mock_budget_repo.create.return_value = budget
+    mock_budget_repo.upsert.return_value = budget
     
     # Act
     result = await budget_service.create_or_update_budget(
@@ -127,22 +138,14 @@ async def test_create_or_update_budget_new(budget_service, mock_budget_repo):
     
     # Assert
     assert result.period == "2025-01"
-    mock_budget_repo.create.assert_called_once()
+    mock_budget_repo.upsert.assert_called_once()
+    mock_budget_repo.find_by_owner_and_period.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_create_or_update_budget_existing(budget_service, mock_budget_repo):
     """Test successful budget update when exists"""
     # Arrange
-    existing_budget = Budget(
-        id=1,
-        owner_type=OwnerType.USER,
-        owner_id=1,
-        period="2025-01",
-        total_amount=1000000,
-        status=BudgetStatus.ACTIVE
-    )
-    
     updated_budget = Budget(
         id=1,
         owner_type=OwnerType.USER,
@@ -152,8 +155,7 @@ async def test_create_or_update_budget_existing(budget_service, mock_budget_repo
         status=BudgetStatus.ACTIVE
     )
     
-    mock_budget_repo.find_by_period.return_value = existing_budget
-    mock_budget_repo.update.return_value = updated_budget
+    mock_budget_repo.upsert.return_value = updated_budget
     
     # Act
     result = await budget_service.create_or_update_budget(
@@ -165,7 +167,8 @@ async def test_create_or_update_budget_existing(budget_service, mock_budget_repo
     
     # Assert
     assert result.total_amount == 1500000
-    mock_budget_repo.update.assert_called_once()
+    upserted = mock_budget_repo.upsert.call_args.args[0]
+    assert upserted.total_amount == 1500000
 
 
 @pytest.mark.asyncio
@@ -201,3 +204,23 @@ async def test_get_budget_status_success(budget_service, mock_budget_repo, mock_
     assert result['total_budget'] == 1000000
     assert result['total_spent'] == 600000
 
+
+@pytest.mark.asyncio
+async def test_get_budget_status_december_period(budget_service, mock_budget_repo, mock_statistics_repo, mock_session):
+    """Test December period spans Dec 1-31 without crossing into January"""
+    # Arrange
+    mock_budget_repo.find_by_owner_and_period.return_value = None
+    mock_statistics_repo.get_summary_statistics.return_value = {'total_expense': 0}
+    mock_session.execute.return_value = []
+    
+    # Act
+    await budget_service.get_budget_status(
+        owner_type=OwnerType.USER,
+        owner_id=1,
+        period="2024-12"
+    )
+    
+    # Assert
+    call = mock_statistics_repo.get_summary_statistics.call_args.kwargs
+    assert call['start_date'] == date(2024, 12, 1)
+    assert call['end_date'] == date(2024, 12, 31)
@@ -51,14 +51,27 @@ async def test_create_category_success(category_service, mock_category_repo):
         created_by=1
     )
     
-    mock_category_repo.create.return_value = category
+    mock_category_repo.create_if_absent.return_value = category
     
     # Act
     result = await category_service.create_category(category)
     
     # Assert
     assert result.name == "새 카테고리"
-    mock_category_repo.create.assert_called_once()
+    mock_category_repo.create_if_absent.assert_called_once()
+    mock_category_repo.find_by_group_and_type.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_category_duplicate(category_service, mock_category_repo):
+    """Test category creation rejected by the unique name key"""
+    # Arrange
+    category = Category(name="식비", type="EXPENSE", group_id=1, created_by=1)
+    mock_category_repo.create_if_absent.return_value = None
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="Category already exists"):
+        await category_service.create_category(category)
 
 
 @pytest.mark.asyncio
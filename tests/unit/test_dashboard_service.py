@@ -81,3 +81,23 @@ async def test_get_monthly_stats_default_month(dashboard_service, mock_statistic
     assert "total_income" in result
     mock_statistics_repo.get_monthly_stats.assert_called_once()
 
+
+
+@pytest.mark.asyncio
+async def test_get_monthly_stats_december_range(mock_statistics_repo):
+    """Test December range ends on the 31st without crossing the year"""
+    # Arrange
+    service = DashboardService(statistics_repository=mock_statistics_repo)
+    mock_statistics_repo.get_daily_summary.return_value = [
+        {"date": "2024-12-31", "income": 0, "expense": 5000, "transaction_count": 1}
+    ]
+    mock_statistics_repo.get_category_statistics.return_value = []
+    
+    # Act
+    result = await service.get_monthly_stats(user_id=1, year=2024, month=12)
+    
+    # Assert
+    assert result["total_expense"] == 5000
+    call = mock_statistics_repo.get_daily_summary.call_args.kwargs
+    assert call["start_date"] == date(2024, 12, 1)
+    assert call["end_date"] == date(2024, 12, 31)
@@ -3,9 +3,14 @@ Unit Tests for GroupService
 """
 
 import pytest
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
+from sqlalchemy import select
 from app.application.services.group_service import GroupService
-from app.domain.models.group import Group
+from app.domain.models.group import Group, GroupInvite
+from app.domain.models.user import User
+from app.infrastructure.repositories.group_repository_impl import GroupRepositoryImpl
+from tests.helpers.db_helpers import sqlite_session
 
 
 @pytest.fixture
@@ -119,3 +124,57 @@ async def test_delete_group_success(group_service, mock_group_repo):
     mock_group_repo.find_by_id.assert_called_once_with(1)
     mock_group_repo.delete.assert_called_once_with(1)
 
+
+
+@pytest.mark.asyncio
+async def test_invite_code_is_single_use(group_service, mock_group_repo):
+    """Test invite code joins once and is then consumed"""
+    # Arrange
+    group = Group(id=1, name="My Group", owner_id=1)
+    mock_group_repo.find_group_by_id.return_value = group
+    mock_group_repo.redeem_invite.side_effect = [group, None]
+    code, expires_at = await group_service.generate_invite_code(1, 1)
+    
+    # Act
+    result = await group_service.join_group(2, code)
+    
+    # Assert
+    assert result.id == 1
+    assert len(code) == 10
+    mock_group_repo.create_invite.assert_called_once_with(
+        group_id=1, code=code, created_by=1, expires_at=expires_at
+    )
+    mock_group_repo.redeem_invite.assert_called_once_with(code, 2)
+    mock_group_repo.find_group_by_id.assert_called_once_with(1)
+    with pytest.raises(ValueError, match="Invalid or expired invite code"):
+        await group_service.join_group(3, code)
+
+
+@pytest.mark.asyncio
+async def test_join_group_deleted_group():
+    """Test an invite to a group that no longer exists is rejected and kept"""
+    async with sqlite_session() as session:
+        # Arrange
+        now = datetime.utcnow()
+        session.add_all([
+            User(
+                id=1, email="owner@example.com", password_hash="x", nickname="Owner",
+                created_at=now, updated_at=now
+            ),
+            User(
+                id=2, email="joiner@example.com", password_hash="x", nickname="Joiner",
+                created_at=now, updated_at=now
+            ),
+            GroupInvite(
+                id=1, group_id=1, code="ABCDE12345", created_by=1,
+                expires_at=now + timedelta(hours=1), created_at=now
+            )
+        ])
+        await session.commit()
+        service = GroupService(group_repository=GroupRepositoryImpl(session))
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid or expired invite code"):
+            await service.join_group(2, "ABCDE12345")
+        assert await session.scalar(select(GroupInvite.id).where(GroupInvite.code == "ABCDE12345")) == 1
+        assert await session.scalar(select(User.group_id).where(User.id == 2)) is None
@@ -295,3 +295,35 @@ async def test_generate_transaction_from_rule_existing_transaction(scheduler_ser
             user_id=1
         )
 
+
+
+@pytest.mark.parametrize("day_rule,frequency", [
+    ("매일", RecurringFrequency.DAILY),
+    ("평일만", RecurringFrequency.DAILY),
+    ("주말만", RecurringFrequency.DAILY),
+    ("월요일, 금요일", RecurringFrequency.WEEKLY),
+    ("매월 말일", RecurringFrequency.MONTHLY),
+    ("매월 31일", RecurringFrequency.MONTHLY),
+    ("매월 5일", RecurringFrequency.MONTHLY),
+])
+def test_occurrence_dates_matches_should_create_transaction(scheduler_service, day_rule, frequency):
+    """Test occurrence_dates agrees with the per-day check over a range"""
+    # Arrange
+    start_date = date(2024, 1, 20)
+    end_date = date(2024, 4, 10)
+    rule_start_date = date(2024, 2, 1)
+    
+    # Act
+    result = scheduler_service.occurrence_dates(
+        day_rule, frequency, start_date, end_date, rule_start_date
+    )
+    
+    # Assert
+    expected = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+        if scheduler_service.should_create_transaction(
+            day_rule, frequency, start_date + timedelta(days=offset), rule_start_date
+        )
+    ]
+    assert result == expected
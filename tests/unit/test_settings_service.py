@@ -4,7 +4,6 @@ Unit Tests for SettingsService
 
 import pytest
 from unittest.mock import AsyncMock
-from sqlalchemy import select
 from app.application.services.settings_service import SettingsService
 from app.domain.models.user import User
 from app.schemas.settings import UpdateSettingsRequest, DEFAULT_SETTINGS
@@ -33,16 +32,12 @@ async def test_get_settings_default(settings_service, mock_session):
         settings=None  # No settings
     )
     
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute.return_value = mock_result
-    
     # Act
-    result = await settings_service.get_settings(1)
+    result = await settings_service.get_settings(user)
     
     # Assert
     assert result == DEFAULT_SETTINGS
-    mock_session.execute.assert_called_once()
+    mock_session.execute.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -62,19 +57,15 @@ async def test_get_settings_existing(settings_service, mock_session):
         settings=existing_settings
     )
     
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute.return_value = mock_result
-    
     # Act
-    result = await settings_service.get_settings(1)
+    result = await settings_service.get_settings(user)
     
     # Assert
     assert result['currency'] == 'USD'
     assert result['theme'] == 'dark'
     # Should merge with defaults
     assert 'show_won_suffix' in result
-    mock_session.execute.assert_called_once()
+    mock_session.execute.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -88,23 +79,48 @@ async def test_update_settings_success(settings_service, mock_session):
         settings={'currency': 'KRW'}
     )
     
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute.return_value = mock_result
-    
     update_request = UpdateSettingsRequest(
         currency="USD",
         theme="dark"
     )
     
     # Act
-    result = await settings_service.update_settings(1, update_request)
+    result = await settings_service.update_settings(user, update_request)
     
     # Assert
     assert result['currency'] == 'USD'
     assert result['theme'] == 'dark'
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_called_once()
+    mock_session.refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_settings_category_display(settings_service, mock_session):
+    """Test partial category display update keeps the other nested values"""
+    # Arrange
+    user = User(
+        id=1,
+        email="test@example.com",
+        nickname="TestUser",
+        settings={'category_display': {'show_icons': False, 'sort_by': 'usage'}}
+    )
+    
+    update_request = UpdateSettingsRequest.model_validate(
+        {'category_display': {'icon_style': 'modern'}}
+    )
+    
+    # Act
+    result = await settings_service.update_settings(user, update_request)
+    
+    # Assert
+    assert result['category_display']['icon_style'] == 'modern'
+    assert result['category_display']['show_icons'] is False
+    assert result['category_display']['sort_by'] == 'usage'
+    assert result['category_display']['color_style'] == 'vibrant'
+    assert user.settings['category_display'] == {
+        'show_icons': False, 'sort_by': 'usage', 'icon_style': 'modern'
+    }
 
 
 @pytest.mark.asyncio
@@ -118,12 +134,8 @@ async def test_reset_settings_success(settings_service, mock_session):
         settings={'currency': 'USD'}
     )
     
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute.return_value = mock_result
-    
     # Act
-    result = await settings_service.reset_settings(1)
+    result = await settings_service.reset_settings(user)
     
     # Assert
     assert result == DEFAULT_SETTINGS
@@ -132,14 +144,21 @@ async def test_reset_settings_success(settings_service, mock_session):
 
 
 @pytest.mark.asyncio
-async def test_get_settings_user_not_found(settings_service, mock_session):
-    """Test getting settings when user not found"""
+async def test_get_settings_reflects_current_user(settings_service, mock_session):
+    """Test settings follow the loaded user without querying"""
     # Arrange
-    mock_result = AsyncMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_session.execute.return_value = mock_result
+    user = User(
+        id=1,
+        email="test@example.com",
+        nickname="TestUser",
+        settings={'currency': 'USD'}
+    )
+    await settings_service.get_settings(user)
+    user.settings = {'currency': 'JPY'}
     
-    # Act & Assert
-    with pytest.raises(ValueError, match="User not found"):
-        await settings_service.get_settings(999)
-
+    # Act
+    result = await settings_service.get_settings(user)
+    
+    # Assert
+    assert result['currency'] == 'JPY'
+    mock_session.execute.assert_not_called()
@@ -44,8 +44,7 @@ async def test_get_transactions_success(transaction_service, mock_transaction_re
         )
     ]
     
-    mock_transaction_repo.find_all.return_value = mock_transactions
-    mock_transaction_repo.count_total.return_value = 2
+    mock_transaction_repo.find_all_with_count.return_value = (mock_transactions, 2)
     
     # Act
     transactions, total = await transaction_service.get_transactions(
@@ -59,8 +58,7 @@ async def test_get_transactions_success(transaction_service, mock_transaction_re
     assert len(transactions) == 2
     assert total == 2
     assert transactions[0].id == 1
-    mock_transaction_repo.find_all.assert_called_once()
-    mock_transaction_repo.count_total.assert_called_once()
+    mock_transaction_repo.find_all_with_count.assert_called_once()
 
 
 @pytest.mark.asyncio